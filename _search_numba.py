@@ -0,0 +1,91 @@
+"""computer.py 탐색용 Numba 커널 (numba가 없으면 import 시 ImportError)
+
+보드는 GomokuAI의 경계 칸 bytearray를 np.frombuffer로 본 uint8 배열이고,
+칸은 1차원 인덱스, 방향은 인덱스 간격 배열로 받음
+시그니처를 지정해 두어 import 때 (캐시에서) 바로 컴파일하므로 첫 수를 둘 때 컴파일 지연이 없음
+"""
+
+import numpy as np
+from numba import njit
+
+# (보드, 후보 칸 인덱스, 둘 돌 값, 상대 돌 값, 방향 간격) -> 후보별 int64 결과
+_CANDIDATE_KERNEL_SIGNATURE = "int64[::1](uint8[::1], int64[::1], int64, int64, int64[::1])"
+
+
+@njit(_CANDIDATE_KERNEL_SIGNATURE, cache=True)
+def light_scores_numba(board, cells, color, opponent, steps):
+    """후보 칸마다 GomokuAI._evaluate_move_pattern_light 점수를 한 번에 계산"""
+    scores = np.zeros(cells.shape[0], dtype=np.int64)
+    for n in range(cells.shape[0]):
+        i = cells[n]
+        score = 0
+        for step in steps:
+            # 내 돌: 앞뒤로 3칸까지만 확인
+            count = 1
+            forward = i + step
+            check_count = 0
+            while check_count < 3 and board[forward] == color:
+                count += 1
+                forward += step
+                check_count += 1
+            backward = i - step
+            check_count = 0
+            while check_count < 3 and board[backward] == color:
+                count += 1
+                backward -= step
+                check_count += 1
+
+            if count >= 4:
+                score += 10000
+            elif count == 3:
+                score += 1000
+            elif count == 2:
+                score += 100
+
+            # 상대 돌
+            opp_count = 0
+            forward = i + step
+            check_count = 0
+            while check_count < 3 and board[forward] == opponent:
+                opp_count += 1
+                forward += step
+                check_count += 1
+            backward = i - step
+            check_count = 0
+            while check_count < 3 and board[backward] == opponent:
+                opp_count += 1
+                backward -= step
+                check_count += 1
+
+            if opp_count >= 3:
+                score -= 5000
+            elif opp_count == 2:
+                score -= 500
+        scores[n] = score
+    return scores
+
+
+@njit(_CANDIDATE_KERNEL_SIGNATURE, cache=True)
+def five_flags_numba(board, cells, color, opponent, steps):
+    """후보 칸마다 그 칸에 돌을 두면 5목이 되는지 (GomokuAI._check_winner(board, i)와 같은 판정)
+
+    비트 1: color가 두면 5목, 비트 2: opponent가 두면 5목
+    """
+    flags = np.zeros(cells.shape[0], dtype=np.int64)
+    for n in range(cells.shape[0]):
+        i = cells[n]
+        for bit, stone in ((1, color), (2, opponent)):
+            for step in steps:
+                count = 1
+                forward = i + step
+                while board[forward] == stone:
+                    count += 1
+                    forward += step
+                backward = i - step
+                while board[backward] == stone:
+                    count += 1
+                    backward -= step
+                if count >= 5:
+                    flags[n] |= bit
+                    break
+    return flags
@@ -1,7 +1,14 @@
 """AI engine package."""
 
-from gomoku.ai.engine import AIEngine
-from gomoku.ai.minimax import MinimaxAI
-
 __all__ = ["AIEngine", "MinimaxAI"]
 
+
+def __getattr__(name: str):
+    """Import the engine classes on first access (PEP 562)."""
+    if name == "AIEngine":
+        from gomoku.ai.engine import AIEngine
+        return AIEngine
+    if name == "MinimaxAI":
+        from gomoku.ai.minimax import MinimaxAI
+        return MinimaxAI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
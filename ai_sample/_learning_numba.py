@@ -0,0 +1,43 @@
+"""Numba-compiled kernel for the Zobrist learning table.
+
+Importing this module raises ImportError if numba is not installed.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def learn_position_numba(keys, scores, counts, key, score, alpha, max_probes):
+    """
+    Probe for a position (inserting it, or evicting the least seen probed
+    entry when all probed slots are taken), then count it and fold its
+    score into the moving average, all in one call.
+
+    Same probing rules as ZobristLearning._claim_slot. ``key`` must be a
+    non-zero np.uint64 so it compares exactly against ``keys``.
+    """
+    mask = np.uint64(keys.shape[0] - 1)
+    slot = np.intp(key & mask)
+    victim = slot
+    found = False
+    for _ in range(max_probes):
+        stored = keys[slot]
+        if stored == key:
+            victim = slot
+            found = True
+            break
+        if stored == 0:
+            victim = slot
+            break
+        if counts[slot] < counts[victim]:
+            victim = slot
+        slot = np.intp(np.uint64(slot + 1) & mask)
+
+    if not found:
+        keys[victim] = key
+        scores[victim] = 0.0
+        counts[victim] = 0
+
+    counts[victim] += 1
+    scores[victim] = (1 - alpha) * scores[victim] + alpha * score
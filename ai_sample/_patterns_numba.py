@@ -0,0 +1,150 @@
+"""Numba-compiled fallback kernels for heuristic pattern scans.
+
+Used when the Cython extensions are unavailable. Importing this module
+raises ImportError if numba is not installed.
+"""
+
+from numba import njit
+
+EMPTY = 0
+
+
+@njit(cache=True)
+def count_line_length_numba(board, row, col, dy, dx, player):
+    """Count consecutive stones through (row, col), capped at 5."""
+    size = board.shape[0]
+    count = 1
+
+    # Forward
+    r, c = row + dy, col + dx
+    while 0 <= r < size and 0 <= c < size and board[r, c] == player and count < 5:
+        count += 1
+        r += dy
+        c += dx
+
+    # Backward
+    if count < 5:
+        r, c = row - dy, col - dx
+        while 0 <= r < size and 0 <= c < size and board[r, c] == player and count < 5:
+            count += 1
+            r -= dy
+            c -= dx
+
+    return count
+
+
+@njit(cache=True)
+def pattern_freedom_numba(board, row, col, dy, dx, player):
+    """Number of empty cells just past both ends of the line (0, 1 or 2)."""
+    size = board.shape[0]
+
+    start_row, start_col = row, col
+    while (
+        0 <= start_row - dy < size
+        and 0 <= start_col - dx < size
+        and board[start_row - dy, start_col - dx] == player
+    ):
+        start_row -= dy
+        start_col -= dx
+
+    end_row, end_col = row, col
+    while (
+        0 <= end_row + dy < size
+        and 0 <= end_col + dx < size
+        and board[end_row + dy, end_col + dx] == player
+    ):
+        end_row += dy
+        end_col += dx
+
+    freedom = 0
+    if 0 <= start_row - dy < size and 0 <= start_col - dx < size:
+        if board[start_row - dy, start_col - dx] == EMPTY:
+            freedom += 1
+    if 0 <= end_row + dy < size and 0 <= end_col + dx < size:
+        if board[end_row + dy, end_col + dx] == EMPTY:
+            freedom += 1
+    return freedom
+
+
+@njit(cache=True, fastmath=True)
+def evaluate_patterns_both_numba(board, player_max, player_min, weights):
+    """
+    Alignment-pattern scores for both players in one board sweep.
+
+    Args:
+        board: C-contiguous 2D board array
+        player_max, player_min: Players to evaluate
+        weights: int32 table indexed by [line length (capped at 5), freedom]
+
+    Returns:
+        (max_score, min_score)
+    """
+    size = board.shape[0]
+    max_score = 0
+    min_score = 0
+    for row in range(size):
+        for col in range(size):
+            player = board[row, col]
+            if player != player_max and player != player_min:
+                continue
+            score = 0
+            for d in range(4):
+                if d == 0:
+                    dy, dx = 0, 1
+                elif d == 1:
+                    dy, dx = 1, 0
+                elif d == 2:
+                    dy, dx = 1, 1
+                else:
+                    dy, dx = 1, -1
+                length = count_line_length_numba(board, row, col, dy, dx, player)
+                if length < 2:
+                    continue
+                freedom = pattern_freedom_numba(board, row, col, dy, dx, player)
+                score += weights[length, freedom]
+            if player == player_max:
+                max_score += score
+            else:
+                min_score += score
+    return max_score, min_score
+
+
+@njit(cache=True)
+def count_capture_threats_both_numba(board, player_max, player_min):
+    """
+    Count player - opp - opp - player patterns for both players in one sweep.
+
+    Returns:
+        (max_count, min_count)
+    """
+    size = board.shape[0]
+    max_count = 0
+    min_count = 0
+    for row in range(size):
+        for col in range(size):
+            player = board[row, col]
+            if player == player_max:
+                opponent = player_min
+            elif player == player_min:
+                opponent = player_max
+            else:
+                continue
+            count = 0
+            for dy in range(-1, 2):
+                for dx in range(-1, 2):
+                    if dy == 0 and dx == 0:
+                        continue
+                    r3, c3 = row + 3 * dy, col + 3 * dx
+                    if not (0 <= r3 < size and 0 <= c3 < size):
+                        continue
+                    if (
+                        board[row + dy, col + dx] == opponent
+                        and board[row + 2 * dy, col + 2 * dx] == opponent
+                        and board[r3, c3] == player
+                    ):
+                        count += 1
+            if player == player_max:
+                max_count += count
+            else:
+                min_count += count
+    return max_count, min_count
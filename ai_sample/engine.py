@@ -1,15 +1,19 @@
 """Main AI engine interface."""
 
-from typing import Optional
+from typing import List, Optional
+import sys
 import time
 
 from gomoku.core.game import Game
 from gomoku.core.position import Position
-from gomoku.ai.minimax import MinimaxAI
 from gomoku.utils.timer import global_timer
 from gomoku.utils.config import config
 
 
+def _noop(*args) -> None:
+    """Stand-in for the verbose loggers when verbose output is off."""
+
+
 class AIEngine:
     """High-level AI engine interface."""
 
@@ -33,8 +37,16 @@ class AIEngine:
         self.time_limit = time_limit
         self.use_multiprocessing = use_multiprocessing
         self.verbose = verbose
+        self._log: List[str] = []
+
+        # Deferred so importing the engine does not pull in the search stack
+        from gomoku.ai.minimax import MinimaxAI
         self.ai = MinimaxAI(depth=depth, use_multiprocessing=use_multiprocessing)
 
+        # Resolve verbose output once instead of branching on every move
+        self._thinking = self._log_thinking_header if verbose else _noop
+        self._report = self._log_move_result if verbose else _noop
+
     def get_move(self, game: Game) -> Optional[Position]:
         """
         Get best move for current game state.
@@ -45,20 +57,7 @@ class AIEngine:
         Returns:
             Best move position, or None if no valid moves
         """
-        global_timer.start_move()
-
-        if self.verbose:
-            self._print_thinking_header()
-
-        start_time = time.time()
-        best_move = self.ai.get_best_move(game)
-        elapsed = time.time() - start_time
-
-        global_timer.end_move()
-
-        if self.verbose:
-            self._print_move_result(best_move, elapsed)
-
+        best_move, _ = self.get_move_with_timing(game)
         return best_move
 
     def get_move_with_timing(self, game: Game) -> tuple[Optional[Position], float]:
@@ -72,63 +71,74 @@ class AIEngine:
             Tuple of (best move position, elapsed time), or (None, 0.0) if no valid moves
         """
         global_timer.start_move()
+        # Show the header while the search runs; the result follows in one write
+        self._thinking()
+        self._flush_log()
 
-        if self.verbose:
-            self._print_thinking_header()
-
-        start_time = time.time()
+        start_time = time.perf_counter()
+        self.ai.heuristic.prepare_root(game)
         best_move = self.ai.get_best_move(game)
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
 
         global_timer.end_move()
-
-        if self.verbose:
-            self._print_move_result(best_move, elapsed)
+        self._report(best_move, elapsed)
+        self._flush_log()
 
         return best_move, elapsed
 
-    def _print_thinking_header(self) -> None:
-        """Print AI thinking header with details."""
-        print("\n" + "=" * 60)
+    def _flush_log(self) -> None:
+        """Write buffered verbose output in a single call."""
+        if self._log:
+            sys.stdout.write("".join(self._log))
+            sys.stdout.flush()
+            self._log.clear()
+
+    def _log_thinking_header(self) -> None:
+        """Buffer AI thinking header with details."""
         algorithm = "Alpha-Beta Pruning" if self.use_multiprocessing else "Alpha-Beta"
         parallel = " (Parallel)" if self.use_multiprocessing else ""
-        print(f"🤖 AI Calculating{parallel}...")
-        print(f"   Algorithm: {algorithm}")
-        print(f"   Max Depth: {self.depth}")
-        print(f"   Time Limit: {self.time_limit}s")
+        self._log.append(
+            "\n" + "=" * 60 + "\n"
+            f"🤖 AI Calculating{parallel}...\n"
+            f"   Algorithm: {algorithm}\n"
+            f"   Max Depth: {self.depth}\n"
+            f"   Time Limit: {self.time_limit}s\n"
+        )
+
+    def _log_move_result(self, best_move: Optional[Position], elapsed: float) -> None:
+        """Buffer detailed move result information."""
+        nodes = self.ai.nodes_explored
 
-    def _print_move_result(self, best_move: Optional[Position], elapsed: float) -> None:
-        """Print detailed move result information."""
         # Calculation metrics
-        print(f"\n⏱️  Calculation Time: {elapsed:.3f} seconds")
-        print(f"🔍 Nodes Explored: {self.ai.nodes_explored:,}")
-        
-        if self.ai.nodes_explored > 0:
-            nodes_per_sec = self.ai.nodes_explored / elapsed if elapsed > 0 else 0
-            print(f"⚡ Search Speed: {nodes_per_sec:,.0f} nodes/sec")
-        
+        parts = [
+            f"\n⏱️  Calculation Time: {elapsed:.3f} seconds\n",
+            f"🔍 Nodes Explored: {nodes:,}\n",
+        ]
+        if nodes > 0:
+            nodes_per_sec = nodes / elapsed if elapsed > 0 else 0
+            parts.append(f"⚡ Search Speed: {nodes_per_sec:,.0f} nodes/sec\n")
+
         # Depth information
-        print(f"📊 Search Depth: {self.depth}")
-        
+        parts.append(f"📊 Search Depth: {self.depth}\n")
+
         # Move selection
         if best_move:
-            print(f"🎯 Selected Move: {best_move}")
+            parts.append(f"🎯 Selected Move: {best_move}\n")
         else:
-            print("❓ No valid move found")
-        
+            parts.append("❓ No valid move found\n")
+
         # Performance validation
         if elapsed <= self.time_limit:
-            status = "✅ PASS"
-            perf_msg = f"Within time limit ({self.time_limit}s)"
+            parts.append(f"✅ PASS: Within time limit ({self.time_limit}s)\n")
         else:
-            status = "⚠️  WARNING"
-            perf_msg = f"Exceeded time limit ({self.time_limit}s)"
-        
-        print(f"{status}: {perf_msg}")
-        print("=" * 60 + "\n")
+            parts.append(f"⚠️  WARNING: Exceeded time limit ({self.time_limit}s)\n")
+        parts.append("=" * 60 + "\n\n")
+
+        self._log.append("".join(parts))
 
     def reset_statistics(self) -> None:
         """Reset timing statistics."""
+        self._flush_log()
         global_timer.reset_stats()
 
     def get_statistics(self) -> dict:
@@ -153,26 +163,23 @@ class AIEngine:
         stats = self.get_statistics()
 
         if stats["total_moves"] == 0:
-            print("No moves made yet")
+            self._log.append("No moves made yet\n")
+            self._flush_log()
             return
 
-        print("\n" + "📊" * 20)
-        print("📈 AI PERFORMANCE STATISTICS")
-        print(f"🎯 Total moves: {stats['total_moves']}")
-        print(f"⏱️  Average time: {stats['average_time']:.3f}s")
-        print(f"⚡ Fastest move: {stats['min_time']:.3f}s")
-        print(f"🐌 Slowest move: {stats['max_time']:.3f}s")
-        print(f"🕒 Total time: {stats['total_time']:.3f}s")
-
         if stats["within_limit"]:
-            print(
-                f"✅ PASS: Average time ≤ {self.time_limit}s "
-                f"({stats['average_time']:.3f}s)"
-            )
+            verdict = f"✅ PASS: Average time ≤ {self.time_limit}s"
         else:
-            print(
-                f"❌ FAIL: Average time > {self.time_limit}s "
-                f"({stats['average_time']:.3f}s)"
-            )
-        print("📊" * 20)
-
+            verdict = f"❌ FAIL: Average time > {self.time_limit}s"
+        self._log.append(
+            "\n" + "📊" * 20 + "\n"
+            "📈 AI PERFORMANCE STATISTICS\n"
+            f"🎯 Total moves: {stats['total_moves']}\n"
+            f"⏱️  Average time: {stats['average_time']:.3f}s\n"
+            f"⚡ Fastest move: {stats['min_time']:.3f}s\n"
+            f"🐌 Slowest move: {stats['max_time']:.3f}s\n"
+            f"🕒 Total time: {stats['total_time']:.3f}s\n"
+            f"{verdict} ({stats['average_time']:.3f}s)\n"
+            + "📊" * 20 + "\n"
+        )
+        self._flush_log()
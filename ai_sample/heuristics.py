@@ -1,6 +1,8 @@
 """Heuristic evaluation functions for game states."""
 
 from typing import Tuple, List, Optional
+from collections import OrderedDict
+from functools import lru_cache
 import numpy as np
 import time
 
@@ -8,51 +10,363 @@ from gomoku.core.game import Game
 from gomoku.core.board import Player
 from gomoku.core.position import Position
 from gomoku.utils.config import config
-from gomoku.ai.zobrist_learning import zobrist_learner
-from gomoku.ai.simple_dynamic import simple_learner
-
-try:
-    from gomoku.cython_ext.optimized import (
-        count_line_length_fast,
-        check_capture_pattern_fast,
-        evaluate_patterns_fast,
-        count_capture_threats_fast,
-        CYTHON_AVAILABLE,
+
+# Optional accelerated backends, probed on first use by _load_cython()
+CYTHON_AVAILABLE = False
+HEURISTIC_CYTHON_AVAILABLE = False
+NUMBA_AVAILABLE = False
+
+
+@lru_cache(maxsize=None)
+def _load_cython() -> None:
+    """
+    Probe the optional Cython extensions (and the Numba kernels when Cython
+    is missing) once, binding whatever is found into module globals.
+    """
+    global CYTHON_AVAILABLE, HEURISTIC_CYTHON_AVAILABLE, NUMBA_AVAILABLE
+    global evaluate_patterns_fast, count_capture_threats_fast
+    global evaluate_position_comprehensive_fast
+    global evaluate_patterns_both_numba, count_capture_threats_both_numba
+
+    try:
+        from gomoku.cython_ext.optimized import (
+            evaluate_patterns_fast,
+            count_capture_threats_fast,
+            CYTHON_AVAILABLE,
+        )
+    except ImportError:
+        CYTHON_AVAILABLE = False
+
+    try:
+        from gomoku.cython_ext.heuristic_optimized import evaluate_position_comprehensive_fast
+        HEURISTIC_CYTHON_AVAILABLE = True
+    except ImportError:
+        HEURISTIC_CYTHON_AVAILABLE = False
+
+    if CYTHON_AVAILABLE:
+        return
+
+    try:
+        from gomoku.ai._patterns_numba import (
+            evaluate_patterns_both_numba,
+            count_capture_threats_both_numba,
+        )
+        NUMBA_AVAILABLE = True
+    except ImportError:
+        NUMBA_AVAILABLE = False
+
+
+# Transposition table for leaf evaluations (LRU-bounded)
+EVAL_CACHE_SIZE = 1 << 20
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
+
+# key -> (value, depth, flag)
+_eval_cache: "OrderedDict[tuple, Tuple[int, int, int]]" = OrderedDict()
+
+
+def clear_eval_cache() -> None:
+    """Drop all memoized evaluations (e.g. after learned scores change)."""
+    _eval_cache.clear()
+
+
+# Pattern weights indexed by [line length (capped at 5), freedom]; built once
+_WEIGHTS = np.array(
+    [
+        [0, 0, 0],
+        [0, 0, 0],
+        [5, config.WEIGHT_TWO_HALF, config.WEIGHT_TWO],
+        [50, config.WEIGHT_THREE_HALF, config.WEIGHT_THREE],
+        [500, config.WEIGHT_FOUR_HALF, config.WEIGHT_FOUR],
+        [config.WEIGHT_WIN, config.WEIGHT_WIN, config.WEIGHT_WIN],
+    ],
+    dtype=np.int32,
+)
+# Same table as nested lists for the pure-Python scorers
+_WEIGHT_ROWS = _WEIGHTS.tolist()
+
+
+def _to_bitboard(mask: np.ndarray) -> int:
+    """
+    Pack a boolean board into a Python int, one bit per cell.
+
+    Rows are laid out with stride ``size + 1``; the extra guard column is
+    always 0 so shifted runs cannot wrap from one row into the next.
+    """
+    size_r, size_c = mask.shape
+    padded = np.zeros((size_r, size_c + 1), dtype=bool)
+    padded[:, :size_c] = mask
+    return int.from_bytes(np.packbits(padded.ravel(), bitorder="little").tobytes(), "little")
+
+
+def _bitboard_pattern_score(stones: int, empty: int, stride: int, weights: list) -> int:
+    """
+    Alignment-pattern score of one player's bitboard.
+
+    For each direction shift ``s`` (1, W, W+1, W-1 with W = stride),
+    maximal runs are found as ``starts = b & ~(b << s)``; runs of length
+    >= k are ``starts & (b >> s) & ... & (b >> (k-1)s)``. Free ends are
+    tested by ANDing with the shifted empty board and tallied with
+    popcount. Every stone of a run scores the run's weight, matching the
+    per-stone Python scan.
+
+    Args:
+        stones: Bitboard of the player's stones
+        empty: Bitboard of empty cells
+        stride: Row stride of the bitboards (board size + 1)
+        weights: Nested list indexed by [line length (capped at 5), freedom]
+
+    Returns:
+        Pattern score
+    """
+    score = 0
+    for shift in (1, stride, stride + 1, stride - 1):
+        starts = stones & ~(stones << shift)
+        before_open = starts & (empty << shift)
+        longer = starts & (stones >> shift)  # runs of length >= 2
+        length = 2
+        while longer:
+            run_ge = longer
+            longer = run_ge & (stones >> (length * shift))
+            exact = run_ge & ~longer
+            if exact:
+                after_open = exact & (empty >> (length * shift))
+                both = before_open & after_open
+                one = (before_open & exact) ^ after_open
+                row = weights[min(length, 5)]
+                score += length * (
+                    both.bit_count() * row[2]
+                    + one.bit_count() * row[1]
+                    + (exact & ~(both | one)).bit_count() * row[0]
+                )
+            length += 1
+    return score
+
+
+def evaluate_patterns_bitboard_both(
+    board_array: np.ndarray, player_max: int, player_min: int
+) -> Tuple[int, int]:
+    """
+    Alignment-pattern scores for both players, sharing the empty bitboard
+    and weight table.
+
+    Returns:
+        (max_score, min_score)
+    """
+    empty = _to_bitboard(board_array == Player.EMPTY)
+    stride = board_array.shape[1] + 1
+    return (
+        _bitboard_pattern_score(_to_bitboard(board_array == player_max), empty, stride, _WEIGHT_ROWS),
+        _bitboard_pattern_score(_to_bitboard(board_array == player_min), empty, stride, _WEIGHT_ROWS),
     )
-except ImportError:
-    CYTHON_AVAILABLE = False
-
-try:
-    from gomoku.cython_ext.heuristic_optimized import (
-        evaluate_position_comprehensive_fast,
-        evaluate_patterns_fast_enhanced,
-        count_capture_threats_fast_enhanced,
+
+
+def _count_captures(p: np.ndarray, o: np.ndarray) -> int:
+    """Count player - opp - opp - player windows along the 4 axes."""
+    count = int((p[:, :-3] & o[:, 1:-2] & o[:, 2:-1] & p[:, 3:]).sum())
+    count += int((p[:-3, :] & o[1:-2, :] & o[2:-1, :] & p[3:, :]).sum())
+    count += int((p[:-3, :-3] & o[1:-2, 1:-2] & o[2:-1, 2:-1] & p[3:, 3:]).sum())
+    count += int((p[:-3, 3:] & o[1:-2, 2:-1] & o[2:-1, 1:-2] & p[3:, :-3]).sum())
+    return count
+
+
+def _five_windows(a: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Sums of every five-cell window along the 4 axes."""
+    return (
+        a[:, :-4] + a[:, 1:-3] + a[:, 2:-2] + a[:, 3:-1] + a[:, 4:],
+        a[:-4, :] + a[1:-3, :] + a[2:-2, :] + a[3:-1, :] + a[4:, :],
+        a[:-4, :-4] + a[1:-3, 1:-3] + a[2:-2, 2:-2] + a[3:-1, 3:-1] + a[4:, 4:],
+        a[:-4, 4:] + a[1:-3, 3:-1] + a[2:-2, 2:-2] + a[3:-1, 1:-3] + a[4:, :-4],
     )
-    HEURISTIC_CYTHON_AVAILABLE = True
-except ImportError:
-    HEURISTIC_CYTHON_AVAILABLE = False
+
+
+def has_four(board_array: np.ndarray, player: int) -> bool:
+    """
+    Check whether player can complete five with a single move.
+
+    Args:
+        board_array: 2D board array
+        player: Player to check
+
+    Returns:
+        True if some five-cell window holds four of player's stones and one empty cell
+    """
+    own = _five_windows((board_array == player).astype(np.int8))
+    empty = _five_windows((board_array == Player.EMPTY).astype(np.int8))
+    return any(bool(((o == 4) & (e == 1)).any()) for o, e in zip(own, empty))
+
+
+def count_capture_threats_numpy_both(
+    board_array: np.ndarray, player_max: int, player_min: int
+) -> Tuple[int, int]:
+    """
+    Capture threat counts for both players using vectorized window matches.
+
+    Each window is reachable from both of its end stones, so it counts twice,
+    matching the per-stone 8-direction scan.
+
+    Returns:
+        (max_count, min_count)
+    """
+    max_mask = board_array == player_max
+    min_mask = board_array == player_min
+    return 2 * _count_captures(max_mask, min_mask), 2 * _count_captures(min_mask, max_mask)
+
+
+def _line_side(rows: list, size: int, row: int, col: int, dy: int, dx: int) -> Tuple[int, int, int]:
+    """
+    Walk from (row, col) along (dy, dx) over one run of equal stones.
+
+    Returns:
+        (stone, run length, 1 if the cell past the run is empty else 0);
+        for an empty or off-board start the run length is 0
+    """
+    if not (0 <= row < size and 0 <= col < size):
+        return Player.EMPTY, 0, 0
+    stone = rows[row][col]
+    if stone == Player.EMPTY:
+        return stone, 0, 1
+    length = 0
+    while 0 <= row < size and 0 <= col < size:
+        cell = rows[row][col]
+        if cell != stone:
+            return stone, length, 1 if cell == Player.EMPTY else 0
+        length += 1
+        row += dy
+        col += dx
+    return stone, length, 0
+
+
+def _run_score(length: int, freedom: int, weights: list) -> int:
+    """Pattern score of one maximal run, as summed by the board scan."""
+    if length < 2:
+        return 0
+    return length * weights[min(length, 5)][freedom]
+
+
+def _move_delta(
+    rows: list,
+    size: int,
+    row: int,
+    col: int,
+    player: int,
+    opponent: int,
+    weights: list,
+    capture_weight: int,
+) -> int:
+    """
+    Static-score change, from ``player``'s perspective, of a quiet move at
+    (row, col).
+
+    The player's runs on both sides merge through the cell, the opponent's
+    adjacent runs lose the cell as a free end, and capture windows through
+    the cell may start to match.
+    """
+    delta = 0
+    for dy, dx in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        before = _line_side(rows, size, row - dy, col - dx, -dy, -dx)
+        after = _line_side(rows, size, row + dy, col + dx, dy, dx)
+        own_before = before[1] if before[0] == player else 0
+        own_after = after[1] if after[0] == player else 0
+        # Ends of the merged run: past the player's run, or the neighbour itself
+        free_before = before[2] if own_before else int(before[0] == Player.EMPTY and before[2])
+        free_after = after[2] if own_after else int(after[0] == Player.EMPTY and after[2])
+        delta += (
+            _run_score(own_before + own_after + 1, free_before + free_after, weights)
+            - _run_score(own_before, free_before + 1, weights)
+            - _run_score(own_after, free_after + 1, weights)
+        )
+        for stone, length, free in (before, after):
+            if stone == opponent:
+                delta -= _run_score(length, free, weights) - _run_score(length, free + 1, weights)
+
+    if capture_weight:
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                if dy == 0 and dx == 0:
+                    continue
+                r1, c1 = row + dy, col + dx
+                r2, c2 = row + 2 * dy, col + 2 * dx
+                if not (0 <= r2 < size and 0 <= c2 < size):
+                    continue
+                # Opponent window: opp - [cell] - player - opp
+                r0, c0 = row - dy, col - dx
+                if (
+                    0 <= r0 < size
+                    and 0 <= c0 < size
+                    and rows[r0][c0] == opponent
+                    and rows[r1][c1] == player
+                    and rows[r2][c2] == opponent
+                ):
+                    delta -= capture_weight
+                # Own window: [cell] - opp - opp - player
+                r3, c3 = row + 3 * dy, col + 3 * dx
+                if (
+                    0 <= r3 < size
+                    and 0 <= c3 < size
+                    and rows[r1][c1] == opponent
+                    and rows[r2][c2] == opponent
+                    and rows[r3][c3] == player
+                ):
+                    delta += capture_weight
+    return delta
 
 
 class Heuristic:
-    """Heuristic evaluator for game positions."""
+    """
+    Heuristic evaluator for game positions.
+
+    Holds no per-position state, so one instance can be shared by a whole
+    search; the game to score is passed to each call.
+    """
+
+    __slots__ = ("use_dynamic", "sequence_score")
 
-    def __init__(self, game: Game, use_dynamic: bool = True) -> None:
+    def __init__(self, use_dynamic: bool = True) -> None:
         """
         Initialize heuristic evaluator.
 
         Args:
-            game: Game instance to evaluate
             use_dynamic: Whether to use dynamic pattern learning
         """
-        self.game = game
         self.use_dynamic = use_dynamic
+        # Sequence-learning score of the current search root (see prepare_root)
+        self.sequence_score = 0
+
+    def prepare_root(self, game: Game) -> None:
+        """
+        Compute the sequence-learning score once for a new search root.
+
+        The learned sequence score depends on the whole move history, so it
+        is evaluated here instead of at every leaf and added to leaf scores
+        as a constant.
 
-    def evaluate(self, maximizing_player: int, depth: int) -> int:
+        Args:
+            game: Root game state of the upcoming search
+        """
+        self.sequence_score = 0
+        if not self.use_dynamic:
+            return
+
+        from gomoku.ai.simple_dynamic import simple_learner
+
+        game_history = game.get_game_history()
+        if len(game_history) >= 2:
+            sequence_score = simple_learner.get_sequence_score(game_history)
+
+            # Apply game phase bonus
+            game_phase = simple_learner.get_game_phase(len(game_history))
+            sequence_score *= simple_learner.get_phase_bonus(game_phase)
+            self.sequence_score = int(sequence_score * 100)  # Higher weight for sequence learning
+
+    def evaluate(self, game: Game, maximizing_player: int, depth: int) -> int:
         """
         Evaluate game state from maximizing player's perspective.
         Now uses Cython optimization when available.
 
         Args:
+            game: Game state to evaluate
             maximizing_player: Player we're trying to maximize score for
             depth: Current search depth (for terminal state bonuses)
 
@@ -60,31 +374,106 @@ class Heuristic:
             Heuristic score (positive favors maximizing player)
         """
         # Check terminal states
-        if self.game.winner is not None and self.game.winner != Player.EMPTY:
-            if self.game.winner == Player.DRAW:
+        winner = game.winner
+        if winner is not None and winner != Player.EMPTY:
+            if winner == Player.DRAW:
                 return 0  # Draw is neutral
-            elif self.game.winner == maximizing_player:
+            elif winner == maximizing_player:
                 return config.WEIGHT_WIN + depth  # Prefer faster wins
             else:
                 return -(config.WEIGHT_WIN + depth)  # Avoid fast losses
 
+        from gomoku.ai.zobrist_learning import get_learner
+
+        _load_cython()
+
+        # Transposition lookup: same board + side + captures + rules -> same score
+        # (the Cython evaluator also takes the depth, so it is part of the key there)
+        board_hash = get_learner().get_game_hash(game)
+        captures = game.captures
+        key = (
+            board_hash,
+            maximizing_player,
+            captures[Player.BLACK],
+            captures[Player.WHITE],
+            game.no_capture,
+            depth if HEURISTIC_CYTHON_AVAILABLE else self.use_dynamic and depth <= 1,
+        )
+        entry = _eval_cache.get(key)
+        if entry is not None:
+            _eval_cache.move_to_end(key)
+            return entry[0] + self.sequence_score
+
+        board_array = get_learner().get_board_array(game)
+        score = self._evaluate_uncached(game, maximizing_player, depth, board_hash, board_array)
+
+        _eval_cache[key] = (score, depth, TT_EXACT)
+        if len(_eval_cache) > EVAL_CACHE_SIZE:
+            _eval_cache.popitem(last=False)
+        return score + self.sequence_score
+
+    def _evaluate_uncached(
+        self,
+        game: Game,
+        maximizing_player: int,
+        depth: int,
+        board_hash: int,
+        board_array: np.ndarray,
+    ) -> int:
+        """
+        Full (non-memoized) evaluation of a non-terminal position.
+
+        Args:
+            game: Game state to evaluate
+            maximizing_player: Player we're trying to maximize score for
+            depth: Current search depth
+            board_hash: Zobrist hash of the current board
+            board_array: Board snapshot shared by all helpers of this call
+
+        Returns:
+            Heuristic score (positive favors maximizing player)
+        """
+        captures = game.captures
+
         # Use Cython optimized version if available
         if HEURISTIC_CYTHON_AVAILABLE:
             return int(evaluate_position_comprehensive_fast(
-                self.game.board.to_array(),
+                board_array,
                 maximizing_player,
-                self.game.captures[Player.BLACK],
-                self.game.captures[Player.WHITE],
+                captures[Player.BLACK],
+                captures[Player.WHITE],
                 depth
             ))
 
         # Fallback to existing Python implementation
+        score = self._static_score(game, maximizing_player, board_array)
+
+        # 4. Dynamic pattern evaluation (learned positions near the horizon only)
+        if self.use_dynamic and depth <= 1:
+            dynamic_score = self._evaluate_dynamic_patterns(game, maximizing_player, board_hash)
+            score += dynamic_score
+
+        return score
+
+    def _static_score(self, game: Game, maximizing_player: int, board_array: np.ndarray) -> int:
+        """
+        Capture, pattern and capture-threat terms of the Python evaluation.
+
+        Args:
+            game: Game state to evaluate
+            maximizing_player: Player we're trying to maximize score for
+            board_array: Board snapshot
+
+        Returns:
+            Score without the dynamic (learned) term
+        """
+        captures = game.captures
         minimizing_player = Player.opponent(maximizing_player)
         score = 0
 
         # 1. Capture advantage
-        max_captures = self.game.captures[maximizing_player]
-        min_captures = self.game.captures[minimizing_player]
+        max_captures = captures[maximizing_player]
+        min_captures = captures[minimizing_player]
         score += (max_captures - min_captures) * config.WEIGHT_CAPTURE
 
         # Bonus if close to winning by captures
@@ -94,346 +483,223 @@ class Heuristic:
             score -= 5000
 
         # 2. Pattern evaluation
-        max_threats = self._evaluate_patterns(maximizing_player)
-        min_threats = self._evaluate_patterns(minimizing_player)
+        max_threats, min_threats = self._evaluate_patterns_both(board_array, maximizing_player)
         score += max_threats - min_threats
 
         # 3. Capture threat evaluation
-        max_threat_count = self._count_capture_threats(maximizing_player)
-        min_threat_count = self._count_capture_threats(minimizing_player)
-        score += (max_threat_count - min_threat_count) * config.WEIGHT_CAPTURE_THREAT
-
-        # 4. Dynamic pattern evaluation
-        if self.use_dynamic:
-            dynamic_score = self._evaluate_dynamic_patterns(maximizing_player)
-            score += dynamic_score
+        if not game.no_capture:
+            max_threat_count, min_threat_count = self._count_capture_threats_both(
+                board_array, maximizing_player
+            )
+            score += (max_threat_count - min_threat_count) * config.WEIGHT_CAPTURE_THREAT
 
         return score
 
-    def _evaluate_patterns(self, player: int) -> int:
+    def evaluate_static(self, game: Game, maximizing_player: int) -> int:
         """
-        Evaluate alignment patterns for a player.
+        Evaluate a non-terminal position without the dynamic (learned) term.
+
+        Pairs with score_moves: a quiet child's static score is this value
+        plus the move's delta.
 
         Args:
-            player: Player to evaluate
+            game: Game state to evaluate
+            maximizing_player: Player we're trying to maximize score for
 
         Returns:
-            Pattern score
+            Static score (positive favors maximizing player)
         """
-        # Use Cython optimized version if available
-        if CYTHON_AVAILABLE:
-            return evaluate_patterns_fast(self.game.board.to_array(), player)
-        
-        # Fallback to Python implementation
-        score = 0
-        board_array = self.game.board.to_array()
-
-        # Check all positions with player's stones
-        for row in range(self.game.board.size):
-            for col in range(self.game.board.size):
-                if board_array[row, col] == player:
-                    # Check all 4 directions
-                    for dy, dx in [(0, 1), (1, 0), (1, 1), (1, -1)]:
-                        length = self._count_line_length(
-                            Position(row, col), player, dy, dx
-                        )
-
-                        if length >= 5:
-                            score += config.WEIGHT_WIN
-                        elif length == 4:
-                            freedom = self._get_pattern_freedom(Position(row, col), player, dy, dx)
-                            if freedom == 2:  # FREE
-                                score += config.WEIGHT_FOUR
-                            elif freedom == 1:  # HALF_FREE
-                                score += config.WEIGHT_FOUR_HALF
-                            else:  # FLANKED
-                                score += 500
-                        elif length == 3:
-                            freedom = self._get_pattern_freedom(Position(row, col), player, dy, dx)
-                            if freedom == 2:  # FREE
-                                score += config.WEIGHT_THREE
-                            elif freedom == 1:  # HALF_FREE
-                                score += config.WEIGHT_THREE_HALF
-                            else:  # FLANKED
-                                score += 50
-                        elif length == 2:
-                            freedom = self._get_pattern_freedom(Position(row, col), player, dy, dx)
-                            if freedom == 2:  # FREE
-                                score += config.WEIGHT_TWO
-                            elif freedom == 1:  # HALF_FREE
-                                score += config.WEIGHT_TWO_HALF
-                            else:  # FLANKED
-                                score += 5
+        from gomoku.ai.zobrist_learning import get_learner
 
-        return score
+        return self._static_score(
+            game, maximizing_player, get_learner().get_board_array(game)
+        )
 
-    def _count_line_length(
-        self, position: Position, player: int, dy: int, dx: int
-    ) -> int:
+    def score_moves(self, game: Game, player: int, moves: List[Position]) -> Optional[List[int]]:
         """
-        Count consecutive stones in a direction.
+        Change of the static score, from ``player``'s perspective, if
+        ``player`` played each of ``moves``.
+
+        Only runs and capture windows through the played cell change, so
+        each delta is computed in closed form from the parent board. The
+        deltas are exact for quiet moves (no stones captured); callers
+        must fall back to a full evaluation otherwise.
 
         Args:
-            position: Starting position
-            player: Player to count
-            dy, dx: Direction vector
+            game: Parent game state
+            player: Player to move
+            moves: Empty cells to score
 
         Returns:
-            Number of consecutive stones
-        """
-        if CYTHON_AVAILABLE:
-            return count_line_length_fast(
-                self.game.board.to_array(),
-                position.row,
-                position.col,
-                dy,
-                dx,
-                player,
-            )
-
-        # Fallback Python implementation
-        count = 1
-        board_array = self.game.board.to_array()
-
-        # Forward
-        r, c = position.row + dy, position.col + dx
-        while (
-            0 <= r < self.game.board.size
-            and 0 <= c < self.game.board.size
-            and board_array[r, c] == player
-            and count < 5
-        ):
-            count += 1
-            r += dy
-            c += dx
-
-        # Backward
-        if count < 5:
-            r, c = position.row - dy, position.col - dx
-            while (
-                0 <= r < self.game.board.size
-                and 0 <= c < self.game.board.size
-                and board_array[r, c] == player
-                and count < 5
-            ):
-                count += 1
-                r -= dy
-                c -= dx
-
-        return count
-
-    def _is_pattern_open(
-        self, position: Position, player: int, dy: int, dx: int
-    ) -> bool:
+            One delta per move, or None when the compiled comprehensive
+            evaluator is active (its terms are not decomposable here)
         """
-        Check if pattern is open (not blocked) on both ends.
+        _load_cython()
+        if HEURISTIC_CYTHON_AVAILABLE:
+            return None
 
-        Args:
-            position: Pattern position
-            player: Player to check
-            dy, dx: Direction vector
+        from gomoku.ai.zobrist_learning import get_learner
 
-        Returns:
-            True if both ends are open
-        """
-        freedom = self._get_pattern_freedom(position, player, dy, dx)
-        return freedom == 2  # FREE
+        rows = get_learner().get_board_array(game).tolist()
+        size = len(rows)
+        opponent = Player.opponent(player)
+        capture_weight = 0 if game.no_capture else 2 * config.WEIGHT_CAPTURE_THREAT
+        return [
+            _move_delta(rows, size, move.row, move.col, player, opponent, _WEIGHT_ROWS, capture_weight)
+            for move in moves
+        ]
 
-    def _get_pattern_freedom(
-        self, position: Position, player: int, dy: int, dx: int
-    ) -> int:
+    def evaluate_child(self, child: Game, maximizing_player: int, static_score: int) -> int:
         """
-        Check pattern freedom status.
+        Finish the evaluation of a quiet child scored via score_moves.
 
         Args:
-            position: Pattern position
-            player: Player to check
-            dy, dx: Direction vector
+            child: Child game state (after the move)
+            maximizing_player: Player we're trying to maximize score for
+            static_score: Parent static score plus the move's delta
 
         Returns:
-            0 = FLANKED (both ends blocked)
-            1 = HALF_FREE (one end free, one blocked)
-            2 = FREE (both ends free)
+            Heuristic score (positive favors maximizing player)
         """
-        board_array = self.game.board.to_array()
-
-        # Find start of pattern
-        start_row, start_col = position.row, position.col
-        while (
-            0 <= start_row - dy < self.game.board.size
-            and 0 <= start_col - dx < self.game.board.size
-            and board_array[start_row - dy, start_col - dx] == player
-        ):
-            start_row -= dy
-            start_col -= dx
-
-        # Find end of pattern
-        end_row, end_col = position.row, position.col
-        while (
-            0 <= end_row + dy < self.game.board.size
-            and 0 <= end_col + dx < self.game.board.size
-            and board_array[end_row + dy, end_col + dx] == player
-        ):
-            end_row += dy
-            end_col += dx
-
-        # Check if ends are empty
-        open_start = (
-            0 <= start_row - dy < self.game.board.size
-            and 0 <= start_col - dx < self.game.board.size
-            and board_array[start_row - dy, start_col - dx] == Player.EMPTY
-        )
-
-        open_end = (
-            0 <= end_row + dy < self.game.board.size
-            and 0 <= end_col + dx < self.game.board.size
-            and board_array[end_row + dy, end_col + dx] == Player.EMPTY
-        )
-
-        # Return freedom status
-        if open_start and open_end:
-            return 2  # FREE
-        elif open_start or open_end:
-            return 1  # HALF_FREE
-        else:
-            return 0  # FLANKED
+        if self.use_dynamic:
+            static_score += self._evaluate_dynamic_patterns(child, maximizing_player)
+        return static_score + self.sequence_score
 
-    def _count_capture_threats(self, player: int) -> int:
+    @staticmethod
+    def _evaluate_patterns_both(board_array: np.ndarray, player_max: int) -> Tuple[int, int]:
         """
-        Count number of potential captures for player.
+        Evaluate alignment patterns for both players in one pass.
 
         Args:
-            player: Player to count threats for
+            board_array: Board snapshot
+            player_max: Maximizing player (the other player is minimizing)
 
         Returns:
-            Number of capture opportunities
+            (max_score, min_score)
         """
-        if self.game.no_capture:
-            return 0
+        player_min = Player.opponent(player_max)
 
         # Use Cython optimized version if available
         if CYTHON_AVAILABLE:
-            return count_capture_threats_fast(self.game.board.to_array(), player)
-        
-        # Fallback to Python implementation
-        threat_count = 0
-        board_array = self.game.board.to_array()
-
-        # Check all player positions
-        for row in range(self.game.board.size):
-            for col in range(self.game.board.size):
-                if board_array[row, col] == player:
-                    # Check capture patterns in all directions
-                    captures = check_capture_pattern_fast(
-                        board_array, row, col, player
-                    )
-                    threat_count += len(captures)
-
-        return threat_count
-
-    def _check_capture_direction(
-        self, position: Position, player: int, dy: int, dx: int
-    ) -> bool:
+            return (
+                evaluate_patterns_fast(board_array, player_max),
+                evaluate_patterns_fast(board_array, player_min),
+            )
+
+        if NUMBA_AVAILABLE:
+            max_score, min_score = evaluate_patterns_both_numba(
+                board_array, player_max, player_min, _WEIGHTS
+            )
+            return int(max_score), int(min_score)
+
+        # Fallback to bitboard implementation
+        return evaluate_patterns_bitboard_both(board_array, player_max, player_min)
+
+    @staticmethod
+    def _count_capture_threats_both(board_array: np.ndarray, player_max: int) -> Tuple[int, int]:
         """
-        Check if capture is possible in direction.
+        Count potential captures for both players in one pass.
 
         Args:
-            position: Starting position
-            player: Player making capture
-            dy, dx: Direction vector
+            board_array: Board snapshot
+            player_max: Maximizing player (the other player is minimizing)
 
         Returns:
-            True if capture possible
+            (max_count, min_count)
         """
-        opponent = Player.opponent(player)
-        board_array = self.game.board.to_array()
+        player_min = Player.opponent(player_max)
 
-        positions = [
-            Position(position.row + i * dy, position.col + i * dx) for i in range(1, 4)
-        ]
+        # Use Cython optimized version if available
+        if CYTHON_AVAILABLE:
+            return (
+                count_capture_threats_fast(board_array, player_max),
+                count_capture_threats_fast(board_array, player_min),
+            )
 
-        # Check bounds
-        if not all(self.game.board.is_valid_position(p) for p in positions):
-            return False
+        if NUMBA_AVAILABLE:
+            max_count, min_count = count_capture_threats_both_numba(
+                board_array, player_max, player_min
+            )
+            return int(max_count), int(min_count)
 
-        # Check pattern: player - opp - opp - player
-        return (
-            board_array[positions[0].row, positions[0].col] == opponent
-            and board_array[positions[1].row, positions[1].col] == opponent
-            and board_array[positions[2].row, positions[2].col] == player
-        )
+        # Fallback: vectorized window match
+        return count_capture_threats_numpy_both(board_array, player_max, player_min)
 
-    def _evaluate_dynamic_patterns(self, maximizing_player: int) -> int:
+    def _evaluate_dynamic_patterns(
+        self, game: Game, maximizing_player: int, board_hash: Optional[int] = None
+    ) -> int:
         """
-        Evaluate dynamic patterns using both Zobrist and sequence learning.
+        Evaluate learned Zobrist position scores.
+
+        The sequence-learning term is computed once per search root by
+        prepare_root.
         
         Args:
+            game: Game state to evaluate
             maximizing_player: Player to maximize for
+            board_hash: Precomputed Zobrist hash of the board (read from game if None)
             
         Returns:
-            Dynamic pattern score
+            Learned position score
         """
         if not self.use_dynamic:
             return 0
-        
-        score = 0
-        
-        # 1. Zobrist position learning
-        board_array = self.game.board.to_array()
-        board_hash = zobrist_learner.get_board_hash(board_array)
-        position_score = zobrist_learner.get_position_score(board_hash)
-        score += int(position_score * 30)  # Reduced weight
-        
-        # 2. Sequence learning (learns from past actions)
-        game_history = self.game.get_game_history()
-        if len(game_history) >= 2:
-            sequence_score = simple_learner.get_sequence_score(game_history)
-            
-            # Apply game phase bonus
-            total_moves = len(game_history)
-            game_phase = simple_learner.get_game_phase(total_moves)
-            phase_bonus = simple_learner.get_phase_bonus(game_phase)
-            
-            sequence_score *= phase_bonus
-            score += int(sequence_score * 100)  # Higher weight for sequence learning
-        
-        return score
+
+        from gomoku.ai.zobrist_learning import get_learner
+
+        # Zobrist position learning
+        if board_hash is None:
+            board_hash = get_learner().get_game_hash(game)
+        position_score = get_learner().get_position_score(board_hash)
+        return int(position_score * 30)  # Reduced weight
     
-    def learn_from_position(self, score: float) -> None:
+    def learn_from_position(self, game: Game, score: float) -> None:
         """
         Learn from current board position.
         
         Args:
+            game: Game whose current board is learned
             score: Evaluation score of current position
         """
         if not self.use_dynamic:
             return
-        
+
+        from gomoku.ai.zobrist_learning import get_learner
+
         # Get Zobrist hash of current board
-        board_array = self.game.board.to_array()
-        board_hash = zobrist_learner.get_board_hash(board_array)
+        board_hash = get_learner().get_game_hash(game)
         
         # Learn from this position
-        zobrist_learner.learn_from_position(board_hash, score)
+        get_learner().learn_from_position(board_hash, score)
     
-    def learn_from_game(self, game_history: List[Tuple[Position, int]], winner: Optional[int]) -> None:
+    def learn_from_game(
+        self, game: Game, game_history: List[Tuple[Position, int]], winner: Optional[int]
+    ) -> None:
         """
         Learn patterns from a completed game.
         
         Args:
+            game: Finished game (its final position is learned)
             game_history: List of (position, player) tuples
             winner: Winner of the game (None if draw)
         """
         if not self.use_dynamic or winner is None:
             return
-        
+
+        from gomoku.ai.zobrist_learning import get_learner
+        from gomoku.ai.simple_dynamic import simple_learner
+
         # 1. Learn from final position (Zobrist)
-        final_score = self.evaluate(winner, 0)  # Evaluate from winner's perspective
-        self.learn_from_position(final_score)
+        self.prepare_root(game)
+        final_score = self.evaluate(game, winner, 0)  # Evaluate from winner's perspective
+        self.learn_from_position(game, final_score)
         
         # 2. Learn from move sequences (NEW - learns from past actions)
         simple_learner.learn_from_game(game_history, winner)
         
         # Clean up old patterns periodically
-        zobrist_learner.clear_old_patterns()
+        get_learner().clear_old_patterns()
+
+        # Learned scores changed, so memoized evaluations are stale
+        clear_eval_cache()
 
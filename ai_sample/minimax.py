@@ -1,14 +1,17 @@
 """Minimax algorithm with Alpha-Beta pruning."""
 
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from concurrent.futures import ProcessPoolExecutor, as_completed
 import multiprocessing
+import time
 
 from gomoku.core.game import Game
 from gomoku.core.position import Position
 from gomoku.core.board import Player
-from gomoku.ai.heuristics import Heuristic
+from gomoku.ai.heuristics import Heuristic, TT_EXACT, TT_LOWER, TT_UPPER, has_four
 from gomoku.ai.move_gen import MoveGenerator
+from gomoku.ai.transposition import SharedTranspositionTable
+from gomoku.ai.zobrist_learning import get_learner
 from gomoku.utils.config import config
 
 # Try to import Cython optimized functions
@@ -18,6 +21,17 @@ try:
 except ImportError:
     MINIMAX_CYTHON_AVAILABLE = False
 
+# Nodes searched between deadline checks
+TIME_CHECK_INTERVAL = 64
+
+# Null-move pruning: minimum remaining depth and depth reduction
+NULL_MOVE_MIN_DEPTH = 3
+NULL_MOVE_REDUCTION = 2
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the move deadline has passed."""
+
 
 class MinimaxAI:
     """Minimax AI with Alpha-Beta pruning and parallel search."""
@@ -38,6 +52,51 @@ class MinimaxAI:
         self.use_multiprocessing = use_multiprocessing
         self.nodes_explored = 0
         self.depth_reached = 0  # Track actual depth reached during search
+        self.heuristic = Heuristic(use_dynamic=True)
+        # (board hash, side to move, captures) -> (depth, score, flag, best_move)
+        self.tt: dict = {}
+        self._search_id = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # Table the pool workers share; cleared once per root search
+        self._shared_tt: Optional[SharedTranspositionTable] = (
+            SharedTranspositionTable() if use_multiprocessing else None
+        )
+        self._shared_tt_search: Optional[int] = None
+        # Monotonic deadline polled by _alpha_beta (None = no limit)
+        self._deadline: Optional[float] = None
+        self._next_time_check = 0
+        self._move_gen: Optional[MoveGenerator] = None
+
+    def __enter__(self) -> "MinimaxAI":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started, and free the shared table."""
+        pool = getattr(self, "_pool", None)
+        if pool is not None:
+            self._pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+        shared_tt = getattr(self, "_shared_tt", None)
+        if shared_tt is not None:
+            self._shared_tt = None
+            shared_tt.close()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the worker pool on first use and reuse it afterwards."""
+        if self._pool is None:
+            max_workers = min(config.MAX_WORKERS, multiprocessing.cpu_count())
+            self._pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(self.max_depth, self._shared_tt.name if self._shared_tt else None),
+            )
+        return self._pool
 
     def get_best_move(self, game: Game, use_iterative_deepening: bool = True, time_limit: float = 0.45) -> Optional[Position]:
         """
@@ -52,6 +111,11 @@ class MinimaxAI:
         Returns:
             Best move position, or None if no valid moves
         """
+        # Entries persist across iterative-deepening depths, not across moves
+        self.tt.clear()
+        self._search_id += 1
+        self._deadline = None
+
         # Try Cython version first for fixed depth
         if MINIMAX_CYTHON_AVAILABLE and not use_iterative_deepening:
             return self.get_best_move_cython(game)
@@ -106,19 +170,18 @@ class MinimaxAI:
     def _get_best_move_iterative(self, game: Game, time_limit: float = 0.45) -> Optional[Position]:
         """
         Iterative deepening: search progressively deeper until time runs out.
-        Guarantees completion within time_limit.
+        Guarantees completion within time_limit: an iteration that hits the
+        deadline is abandoned and the previous depth's move is kept.
         """
-        import time
-        
-        start_time = time.time()
+        start_time = time.monotonic()
         best_move = None
         best_score = float('-inf')
         depth_reached = 0
         total_nodes_explored = 0  # Track total nodes across all depths
+        depth_scores = {}  # depth -> root score, seeds aspiration windows
         
         # Get candidate moves once
-        move_gen = MoveGenerator(game)
-        possible_moves = move_gen.get_ordered_moves(self.max_depth)
+        possible_moves = self._ordered_moves(game, self.max_depth)
         
         if not possible_moves:
             return None
@@ -126,23 +189,27 @@ class MinimaxAI:
             return possible_moves[0]
         
         # Iteratively deepen search
+        self._deadline = start_time + time_limit
         for current_depth in range(1, self.max_depth + 1):
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             
             # Check if we have time for another iteration
             if elapsed > time_limit * 0.85:  # Use 85% as cutoff for safety
                 break
             
-            # Estimate if next depth will fit in time
-            if current_depth > 2:
-                time_per_depth = elapsed / current_depth
-                estimated_next = time_per_depth * 3  # Each depth ~3x slower
-                if elapsed + estimated_next > time_limit:
-                    break
-            
+            # Search the previous iteration's best move first
+            if best_move is not None:
+                possible_moves.remove(best_move)
+                possible_moves.insert(0, best_move)
+
             # Reset nodes for this depth iteration
             self.nodes_explored = 0
+            self._next_time_check = TIME_CHECK_INTERVAL
             maximizing_player = game.current_player
+
+            # Scores swing between odd and even depths, so the window is
+            # centred on the last score with the same side at the horizon
+            guess = depth_scores.get(current_depth - 2)
             
             # Search at current depth
             try:
@@ -151,6 +218,11 @@ class MinimaxAI:
                     move, score = self._parallel_search_root(
                         game, possible_moves, maximizing_player, float('-inf'), float('inf')
                     )
+                elif guess is not None and abs(guess) < config.WEIGHT_WIN - 100:
+                    # Aspiration window around the expected score
+                    move, score = self._aspiration_search_root(
+                        game, possible_moves, maximizing_player, current_depth, guess
+                    )
                 else:
                     # Sequential search for this depth
                     move, score = self._sequential_search_root(
@@ -160,6 +232,7 @@ class MinimaxAI:
                 if move:
                     best_move = move
                     best_score = score
+                    depth_scores[current_depth] = score
                     depth_reached = current_depth
                 
                 # Accumulate nodes explored at this depth
@@ -169,12 +242,20 @@ class MinimaxAI:
                 if score >= config.WEIGHT_WIN - 100:
                     break
                     
+            except SearchTimeout:
+                # Partial result from this depth is unreliable; keep the last one
+                total_nodes_explored += self.nodes_explored
+                break
             except KeyboardInterrupt:
                 break
+        self._deadline = None
         
         # Set final nodes explored count and depth reached
         self.nodes_explored = total_nodes_explored
         self.depth_reached = depth_reached
+        if best_move is None:
+            # Not even depth 1 finished; fall back to the best-ordered move
+            best_move = possible_moves[0]
         return best_move
     
     def _get_best_move_fixed_depth(self, game: Game) -> Optional[Position]:
@@ -184,8 +265,7 @@ class MinimaxAI:
         maximizing_player = game.current_player
 
         # Get candidate moves
-        move_gen = MoveGenerator(game)
-        possible_moves = move_gen.get_ordered_moves(self.max_depth)
+        possible_moves = self._ordered_moves(game, self.max_depth)
 
         if not possible_moves:
             return None
@@ -212,14 +292,64 @@ class MinimaxAI:
 
         return best_move
     
+    def _aspiration_search_root(
+        self,
+        game: Game,
+        moves: list,
+        maximizing_player: int,
+        depth: int,
+        guess: float,
+    ) -> Tuple[Optional[Position], float]:
+        """
+        Root search in a narrow window around a previous score.
+
+        A result on or outside the window is only a bound, so the side that
+        failed is opened to infinity and the other side is pulled in to
+        delta past the result. A side that has been opened stays open, so
+        the search ends with at most two re-searches.
+
+        Args:
+            game: Current game state
+            moves: List of candidate moves
+            maximizing_player: Player to maximize for
+            depth: Search depth
+            guess: Expected score, usually from an earlier depth
+
+        Returns:
+            Tuple of (best_move, best_score)
+        """
+        inf = float('inf')
+        delta = 2 * config.WEIGHT_THREE
+        alpha, beta = guess - delta, guess + delta
+        while True:
+            move, score = self._sequential_search_root(
+                game, moves, maximizing_player, depth, alpha, beta
+            )
+            if score <= alpha and alpha != -inf:
+                # Fail low: the true score is at most this
+                alpha = -inf
+                if beta != inf:
+                    beta = min(beta, score + delta)
+            elif score >= beta and beta != inf:
+                # Fail high: the true score is at least this
+                beta = inf
+                if alpha != -inf:
+                    alpha = max(alpha, score - delta)
+            else:
+                return move, score
+    
     def _sequential_search_root(
-        self, game: Game, moves: list, maximizing_player: int, depth: int
+        self,
+        game: Game,
+        moves: list,
+        maximizing_player: int,
+        depth: int,
+        alpha: float = float('-inf'),
+        beta: float = float('inf'),
     ) -> Tuple[Optional[Position], float]:
         """Sequential search at root level."""
         best_move = None
         best_score = float('-inf')
-        alpha = float('-inf')
-        beta = float('inf')
         
         for move in moves:
             score = self._evaluate_move(
@@ -259,33 +389,37 @@ class MinimaxAI:
         best_move = None
         best_score = float('-inf')
 
-        max_workers = min(config.MAX_WORKERS, multiprocessing.cpu_count())
-
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all moves for evaluation
-            future_to_move = {
-                executor.submit(
-                    _evaluate_move_worker,
-                    game.fast_copy(),  # Use fast_copy for AI search (100x faster!)
-                    move,
-                    self.max_depth,
-                    maximizing_player,
-                    alpha,
-                    beta,
-                ): move
-                for move in moves
-            }
-
-            # Collect results
-            for future in as_completed(future_to_move):
-                move = future_to_move[future]
-                try:
-                    score = future.result()
-                    if score > best_score:
-                        best_score = score
-                        best_move = move
-                except Exception as e:
-                    print(f"Error evaluating move {move}: {e}")
+        executor = self._get_pool()
+        if self._shared_tt is not None and self._shared_tt_search != self._search_id:
+            # Workers are idle between searches, so this cannot race a store
+            self._shared_tt.clear()
+            self._shared_tt_search = self._search_id
+
+        # Submit all moves for evaluation
+        future_to_move = {
+            executor.submit(
+                _evaluate_move_worker,
+                game.fast_copy(),  # Use fast_copy for AI search (100x faster!)
+                move,
+                self.max_depth,
+                maximizing_player,
+                alpha,
+                beta,
+                self._search_id,
+            ): move
+            for move in moves
+        }
+
+        # Collect results
+        for future in as_completed(future_to_move):
+            move = future_to_move[future]
+            try:
+                score = future.result()
+                if score > best_score:
+                    best_score = score
+                    best_move = move
+            except Exception as e:
+                print(f"Error evaluating move {move}: {e}")
 
         return best_move, best_score
 
@@ -311,12 +445,18 @@ class MinimaxAI:
         Returns:
             Move score
         """
+        parent_hash = get_learner().get_game_hash(game)
+        parent_captures = game.captures[Player.BLACK] + game.captures[Player.WHITE]
+        player = game.current_player
+
         game_copy = game.fast_copy()
         result = game_copy.make_move(move)
 
         if not result.success:
             return float('-inf')
 
+        get_learner().track_move(game_copy, parent_hash, move, player, parent_captures)
+
         # Terminal state check
         if result.is_winning_move:
             return config.WEIGHT_WIN + depth
@@ -343,6 +483,7 @@ class MinimaxAI:
         beta: float,
         is_maximizing: bool,
         maximizing_player: int,
+        allow_null: bool = True,
     ) -> Tuple[float, Optional[Position]]:
         """
         Alpha-Beta pruning implementation.
@@ -354,34 +495,97 @@ class MinimaxAI:
             beta: Beta value
             is_maximizing: True if maximizing player's turn
             maximizing_player: Player to maximize for
+            allow_null: False directly below a null move (no two passes in a row)
 
         Returns:
             Tuple of (score, best_move)
         """
         self.nodes_explored += 1
 
+        if self._deadline is not None and self.nodes_explored >= self._next_time_check:
+            self._next_time_check = self.nodes_explored + TIME_CHECK_INTERVAL
+            if time.monotonic() > self._deadline:
+                raise SearchTimeout
+
         # Terminal conditions
         if depth == 0 or game.is_game_over():
-            heuristic = Heuristic(game)
-            score = heuristic.evaluate(maximizing_player, depth)
+            score = self.heuristic.evaluate(game, maximizing_player, depth)
             return score, None
 
+        # Transposition table probe
+        parent_hash = get_learner().get_game_hash(game)
+        player = game.current_player
+        tt_key = (parent_hash, player, game.captures[Player.BLACK], game.captures[Player.WHITE])
+        tt_move = None
+        entry = self.tt.get(tt_key)
+        if entry is not None:
+            entry_depth, entry_score, entry_flag, tt_move = entry
+            if entry_depth >= depth:
+                if entry_flag == TT_EXACT:
+                    return entry_score, tt_move
+                if entry_flag == TT_LOWER:
+                    alpha = max(alpha, entry_score)
+                else:
+                    beta = min(beta, entry_score)
+                if alpha >= beta:
+                    return entry_score, tt_move
+        alpha_orig, beta_orig = alpha, beta
+
+        # Null-move pruning: if passing still fails high (low) at reduced
+        # depth, a real move would too. Gomoku has no zugzwang, but passing
+        # is never tried while the opponent has a four to complete.
+        if allow_null and depth >= NULL_MOVE_MIN_DEPTH:
+            bound = beta if is_maximizing else alpha
+            if abs(bound) != float('inf') and not has_four(
+                get_learner().get_board_array(game), Player.opponent(player)
+            ):
+                null_game = game.fast_copy()
+                null_game.switch_player()
+                null_depth = depth - 1 - NULL_MOVE_REDUCTION
+                if is_maximizing:
+                    score, _ = self._alpha_beta(
+                        null_game, null_depth, beta - 1, beta, False, maximizing_player, False
+                    )
+                    if score >= beta:
+                        return beta, None
+                else:
+                    score, _ = self._alpha_beta(
+                        null_game, null_depth, alpha, alpha + 1, True, maximizing_player, False
+                    )
+                    if score <= alpha:
+                        return alpha, None
+
         # Get candidate moves
-        move_gen = MoveGenerator(game)
         max_moves = config.MAX_MOVES_DEPTH_HIGH if depth >= 7 else config.MAX_MOVES_DEPTH_LOW
-        possible_moves = move_gen.get_ordered_moves(depth, max_moves)
+        possible_moves = self._ordered_moves(game, depth, max_moves, pv_move=tt_move)
 
         if not possible_moves:
-            heuristic = Heuristic(game)
-            score = heuristic.evaluate(maximizing_player, depth)
+            score = self.heuristic.evaluate(game, maximizing_player, depth)
             return score, None
 
         best_move = None
+        parent_captures = game.captures[Player.BLACK] + game.captures[Player.WHITE]
+
+        # Last ply: score quiet children from the parent's static score, and
+        # visit them best-first so the cutoff comes as early as possible
+        leaf_scores = None
+        children = list(enumerate(possible_moves))
+        if depth == 1:
+            deltas = self.heuristic.score_moves(game, player, possible_moves)
+            if deltas is not None:
+                static_score = self.heuristic.evaluate_static(game, maximizing_player)
+                sign = 1 if player == maximizing_player else -1
+                leaf_scores = [static_score + sign * delta for delta in deltas]
+                children.sort(key=lambda child: leaf_scores[child[0]], reverse=is_maximizing)
+
+        # Principal-variation search: the first child gets the full window,
+        # later ones a null window, re-searched only if they fail high (low)
+        pv_searched = False
 
         if is_maximizing:
             max_eval = float('-inf')
 
-            for move in possible_moves:
+            for index, move in children:
                 game_copy = game.fast_copy()  # Use fast_copy for AI search
                 result = game_copy.make_move(move)
 
@@ -391,11 +595,24 @@ class MinimaxAI:
                 if result.is_winning_move:
                     return config.WEIGHT_WIN + depth, move
 
+                get_learner().track_move(game_copy, parent_hash, move, player, parent_captures)
                 game_copy.switch_player()
 
-                eval_score, _ = self._alpha_beta(
-                    game_copy, depth - 1, alpha, beta, False, maximizing_player
-                )
+                eval_score = self._leaf_score(game_copy, leaf_scores, index, parent_captures, maximizing_player)
+                if eval_score is None:
+                    if pv_searched and alpha != float('-inf'):
+                        eval_score, _ = self._alpha_beta(
+                            game_copy, depth - 1, alpha, alpha + 1, False, maximizing_player
+                        )
+                        if alpha < eval_score < beta:
+                            eval_score, _ = self._alpha_beta(
+                                game_copy, depth - 1, eval_score, beta, False, maximizing_player
+                            )
+                    else:
+                        eval_score, _ = self._alpha_beta(
+                            game_copy, depth - 1, alpha, beta, False, maximizing_player
+                        )
+                    pv_searched = True
 
                 if eval_score > max_eval:
                     max_eval = eval_score
@@ -405,12 +622,13 @@ class MinimaxAI:
                 if beta <= alpha:
                     break  # Beta cutoff
 
+            self._store_tt(tt_key, depth, max_eval, alpha_orig, beta_orig, best_move)
             return max_eval, best_move
 
         else:  # Minimizing
             min_eval = float('inf')
 
-            for move in possible_moves:
+            for index, move in children:
                 game_copy = game.fast_copy()  # Use fast_copy for AI search
                 result = game_copy.make_move(move)
 
@@ -420,11 +638,24 @@ class MinimaxAI:
                 if result.is_winning_move:
                     return -(config.WEIGHT_WIN + depth), move
 
+                get_learner().track_move(game_copy, parent_hash, move, player, parent_captures)
                 game_copy.switch_player()
 
-                eval_score, _ = self._alpha_beta(
-                    game_copy, depth - 1, alpha, beta, True, maximizing_player
-                )
+                eval_score = self._leaf_score(game_copy, leaf_scores, index, parent_captures, maximizing_player)
+                if eval_score is None:
+                    if pv_searched and beta != float('inf'):
+                        eval_score, _ = self._alpha_beta(
+                            game_copy, depth - 1, beta - 1, beta, True, maximizing_player
+                        )
+                        if alpha < eval_score < beta:
+                            eval_score, _ = self._alpha_beta(
+                                game_copy, depth - 1, alpha, eval_score, True, maximizing_player
+                            )
+                    else:
+                        eval_score, _ = self._alpha_beta(
+                            game_copy, depth - 1, alpha, beta, True, maximizing_player
+                        )
+                    pv_searched = True
 
                 if eval_score < min_eval:
                     min_eval = eval_score
@@ -434,8 +665,96 @@ class MinimaxAI:
                 if beta <= alpha:
                     break  # Alpha cutoff
 
+            self._store_tt(tt_key, depth, min_eval, alpha_orig, beta_orig, best_move)
             return min_eval, best_move
 
+    def _ordered_moves(
+        self,
+        game: Game,
+        depth: int,
+        max_moves: Optional[int] = None,
+        pv_move: Optional[Position] = None,
+    ) -> List[Position]:
+        """Ordered candidate moves from one generator, rebound to each node's game."""
+        move_gen = self._move_gen
+        if move_gen is None:
+            move_gen = self._move_gen = MoveGenerator(game)
+        else:
+            move_gen.game = game
+        return move_gen.get_ordered_moves(depth, max_moves, pv_move=pv_move)
+
+    def _store_tt(
+        self,
+        key: tuple,
+        depth: int,
+        score: float,
+        alpha: float,
+        beta: float,
+        best_move: Optional[Position],
+    ) -> None:
+        """
+        Record a searched node in the transposition table.
+
+        Args:
+            key: Position key (board hash, side to move, captures)
+            depth: Remaining depth the node was searched to
+            score: Score returned by the search
+            alpha, beta: Window the node was searched with
+            best_move: Best move found (None if no legal move)
+        """
+        if score <= alpha:
+            flag = TT_UPPER
+        elif score >= beta:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        self.tt[key] = (depth, score, flag, best_move)
+
+    def _leaf_score(
+        self,
+        child: Game,
+        leaf_scores: Optional[List[int]],
+        index: int,
+        parent_captures: int,
+        maximizing_player: int,
+    ) -> Optional[int]:
+        """
+        Score a last-ply child from the batched move deltas.
+
+        Args:
+            child: Child game state (after the move)
+            leaf_scores: Static scores of the children, or None if unavailable
+            index: Position of the child's move in the candidate list
+            parent_captures: Total captured pairs before the move
+            maximizing_player: Player to maximize for
+
+        Returns:
+            Leaf score, or None if the child must be evaluated in full
+            (deltas unavailable, stones were captured, or the game ended)
+        """
+        if leaf_scores is None:
+            return None
+        if child.captures[Player.BLACK] + child.captures[Player.WHITE] != parent_captures:
+            return None
+        if child.is_game_over():
+            return None
+
+        self.nodes_explored += 1
+        return self.heuristic.evaluate_child(child, maximizing_player, leaf_scores[index])
+
+
+# Per-process search state, set up once by the pool initializer
+_worker_ai: Optional[MinimaxAI] = None
+_worker_search_id: Optional[int] = None
+
+
+def _init_worker(depth: int, tt_name: Optional[str] = None) -> None:
+    """Pool initializer: build the worker's MinimaxAI once, on the shared table if given."""
+    global _worker_ai
+    _worker_ai = MinimaxAI(depth=depth, use_multiprocessing=False)
+    if tt_name is not None:
+        _worker_ai.tt = SharedTranspositionTable(name=tt_name)
+
 
 def _evaluate_move_worker(
     game: Game,
@@ -444,6 +763,7 @@ def _evaluate_move_worker(
     maximizing_player: int,
     alpha: float,
     beta: float,
+    search_id: int = 0,
 ) -> float:
     """
     Worker function for parallel move evaluation.
@@ -454,10 +774,18 @@ def _evaluate_move_worker(
         depth: Search depth
         maximizing_player: Player to maximize for
         alpha, beta: Alpha-beta bounds
+        search_id: Root search the task belongs to; a private worker
+            transposition table is kept only within one search (the
+            shared one is cleared by the parent)
 
     Returns:
         Move score
     """
-    ai = MinimaxAI(depth=depth, use_multiprocessing=False)
-    return ai._evaluate_move(game, move, depth, maximizing_player, alpha, beta)
-
+    global _worker_ai, _worker_search_id
+    if _worker_ai is None:
+        _worker_ai = MinimaxAI(depth=depth, use_multiprocessing=False)
+    if search_id != _worker_search_id:
+        if isinstance(_worker_ai.tt, dict):
+            _worker_ai.tt.clear()
+        _worker_search_id = search_id
+    return _worker_ai._evaluate_move(game, move, depth, maximizing_player, alpha, beta)
@@ -3,10 +3,13 @@ from typing import List, Tuple, Optional
 from dataclasses import dataclass
 import random
 
+import numpy as np
+
 from gomoku.core.game import Game
 from gomoku.core.board import Player
 from gomoku.core.position import Position
 from gomoku.utils.config import config
+from gomoku.ai.zobrist_learning import get_learner
 
 try:
     from gomoku.cython_ext.optimized import (
@@ -19,6 +22,41 @@ except ImportError:
     CYTHON_AVAILABLE = False
 
 
+def _hoist(moves: List[Position], pv_move: Optional[Position]) -> List[Position]:
+    """Move pv_move to the front of moves if present (in place)."""
+    if pv_move is not None and pv_move in moves:
+        moves.remove(pv_move)
+        moves.insert(0, pv_move)
+    return moves
+
+
+def _top_k_order(priorities: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest priorities, best first.
+
+    Ties keep their original order, so the result is the first k entries of
+    a stable descending sort without sorting the whole array.
+
+    Args:
+        priorities: 1D array of move priorities
+        k: Number of indices to return
+
+    Returns:
+        Index array of length min(k, len(priorities))
+    """
+    negated = -priorities
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(negated):
+        kth = np.partition(negated, k - 1)[k - 1]
+        ahead = np.flatnonzero(negated < kth)
+        ties = np.flatnonzero(negated == kth)[:k - len(ahead)]
+        selected = np.sort(np.concatenate((ahead, ties)))
+    else:
+        selected = np.arange(len(negated))
+    return selected[np.argsort(negated[selected], kind="stable")]
+
+
 @dataclass
 class PrioritizedMove:
     """Move with priority score."""
@@ -38,18 +76,26 @@ class MoveGenerator:
             game: Game instance
         """
         self.game = game
+        # Board snapshot shared by every candidate scored from this node
+        self._board_array = get_learner().get_board_array(game)
 
-    def get_ordered_moves(self, depth: int, max_moves: Optional[int] = None) -> List[Position]:
+    def get_ordered_moves(
+        self, depth: int, max_moves: Optional[int] = None, pv_move: Optional[Position] = None
+    ) -> List[Position]:
         """
         Get candidate moves ordered by priority.
 
         Args:
             depth: Current search depth
             max_moves: Maximum number of moves to return (None = all)
+            pv_move: Best move from a previous search of this position,
+                searched first if it is among the candidates
 
         Returns:
             List of positions ordered by priority (best first)
         """
+        self._board_array = get_learner().get_board_array(self.game)
+
         # Use Cython optimized version if available
         if CYTHON_AVAILABLE:
             # Determine max moves based on depth
@@ -61,7 +107,7 @@ class MoveGenerator:
             
             # Use enhanced move generation for better quality
             moves = get_ordered_moves_enhanced_fast(
-                self.game.board.to_array(),
+                self._board_array,
                 self.game.current_player,
                 max_moves,
                 config.SEARCH_DISTANCE,
@@ -69,7 +115,7 @@ class MoveGenerator:
             )
             
             # Convert to Position objects
-            return [Position(row, col) for row, col in moves]
+            return _hoist([Position(row, col) for row, col in moves], pv_move)
         
         if self.game.board.is_empty_board():
             center = self.game.board.get_center_position()
@@ -97,53 +143,67 @@ class MoveGenerator:
             return []
 
         # Evaluate and prioritize moves
-        prioritized = []
+        positions = []
+        priorities = []
         for pos in candidates:
             can_move, _ = self.game.can_move(pos)
             if can_move:
-                priority = self._evaluate_move_priority(pos)
-                prioritized.append(PrioritizedMove(pos, priority))
-
-        # Sort by priority (descending)
-        prioritized.sort(key=lambda m: m.priority, reverse=True)
-
-        # Group by priority level for better organization
-        winning_moves = [m for m in prioritized if m.priority >= 40000]
-        blocking_moves = [m for m in prioritized if 20000 <= m.priority < 40000]
-        threat_moves = [m for m in prioritized if 5000 <= m.priority < 20000]
-        good_moves = [m for m in prioritized if 100 <= m.priority < 5000]
-        default_moves = [m for m in prioritized if m.priority < 100]
-
-        # Build final move list
+                positions.append(pos)
+                priorities.append(self._evaluate_move_priority(pos))
+
+        # Only the top of the order is used: every winning, blocking and threat
+        # move, plus at most max_moves good or default moves
+        priority_array = np.array(priorities, dtype=np.int64)
+        keep = int(np.count_nonzero(priority_array >= 5000)) + max_moves
+        order = _top_k_order(priority_array, keep).tolist()
+
+        # Build the final list in one pass; the sort keeps each priority band
+        # (win, block, threat, good, default) contiguous, so every band's cap
+        # is fixed when its first move is reached
         result = []
-        result.extend([m.position for m in winning_moves])
-        result.extend([m.position for m in blocking_moves])
-
-        # Add some threats
-        current_len = len(result)
-        result.extend([m.position for m in threat_moves[:2]])
-
-        # Fill up to max_moves with good moves
-        if len(result) < max_moves and good_moves:
-            needed = max(1, max_moves - current_len)
-            result.extend([m.position for m in good_moves[:needed]])
-
-        # Fill remaining with default moves
-        current_len = len(result)
-        if len(result) < max_moves and default_moves:
-            needed = max_moves - current_len
-            result.extend([m.position for m in default_moves[:needed]])
-
-        # Remove duplicates while preserving order
         seen = set()
-        unique_result = []
-        for pos in result:
-            pos_tuple = (pos.row, pos.col)
+        threats_taken = 0
+        before_threats = None  # list length before the first threat
+        good_left = None
+        default_left = None
+        for i in order:
+            priority = priorities[i]
+            if priority >= 20000:
+                # Winning and blocking moves are always kept
+                pass
+            elif priority >= 5000:
+                # Add some threats
+                if before_threats is None:
+                    before_threats = len(result)
+                if threats_taken == 2:
+                    continue
+                threats_taken += 1
+            elif priority >= 100:
+                # Fill up to max_moves with good moves
+                if good_left is None:
+                    if len(result) < max_moves:
+                        base = len(result) if before_threats is None else before_threats
+                        good_left = max(1, max_moves - base)
+                    else:
+                        good_left = 0
+                if good_left == 0:
+                    continue
+                good_left -= 1
+            else:
+                # Fill remaining with default moves
+                if default_left is None:
+                    default_left = max_moves - len(result)
+                if default_left <= 0:
+                    break
+                default_left -= 1
+
+            # Skip duplicates while preserving order
+            pos_tuple = (positions[i].row, positions[i].col)
             if pos_tuple not in seen:
                 seen.add(pos_tuple)
-                unique_result.append(pos)
+                result.append(positions[i])
 
-        return unique_result[:max_moves]
+        return _hoist(result, pv_move)[:max_moves]
 
     def _evaluate_move_priority(self, position: Position) -> int:
         """
@@ -158,7 +218,7 @@ class MoveGenerator:
         if CYTHON_AVAILABLE:
             # Use fast Cython implementation
             return evaluate_position_fast(
-                self.game.board.to_array(),
+                self._board_array,
                 position.row,
                 position.col,
                 self.game.current_player,
@@ -181,6 +241,8 @@ class MoveGenerator:
         priority = 0
         player = self.game.current_player
         opponent = Player.opponent(player)
+        board_array = self._board_array
+        size = board_array.shape[0]
 
         # Make a fast copy to test the move (no history needed)
         test_game = self.game.fast_copy()
@@ -200,9 +262,10 @@ class MoveGenerator:
             captures = test_game.validator.check_captures(position, player)
             priority += len(captures) * 500
 
-        # Check threats (4-in-a-row, 3-in-a-row)
+        # Check threats (4-in-a-row, 3-in-a-row); the line count only reads
+        # the neighbours, so the parent snapshot serves for the test stone
         for dy, dx in [(0, 1), (1, 0), (1, 1), (1, -1)]:
-            length = self._count_line(test_game, position, player, dy, dx)
+            length = self._count_line(board_array, size, position, player, dy, dx)
             if length >= 4:
                 priority += 15000
             elif length == 3:
@@ -225,20 +288,22 @@ class MoveGenerator:
 
         # Check if blocks opponent threats
         for dy, dx in [(0, 1), (1, 0), (1, 1), (1, -1)]:
-            length = self._count_line(test_game, position, opponent, dy, dx)
+            length = self._count_line(board_array, size, position, opponent, dy, dx)
             if length >= 4:
                 priority += 12000
 
         return priority
 
+    @staticmethod
     def _count_line(
-        self, game: Game, position: Position, player: int, dy: int, dx: int
+        board_array, size: int, position: Position, player: int, dy: int, dx: int
     ) -> int:
         """
         Count consecutive stones in direction.
 
         Args:
-            game: Game instance
+            board_array: Board snapshot as a 2D array
+            size: Board size
             position: Starting position
             player: Player to count
             dy, dx: Direction vector
@@ -247,13 +312,12 @@ class MoveGenerator:
             Line length
         """
         count = 1
-        board_array = game.board.to_array()
 
         # Forward
         r, c = position.row + dy, position.col + dx
         while (
-            0 <= r < game.board.size
-            and 0 <= c < game.board.size
+            0 <= r < size
+            and 0 <= c < size
             and board_array[r, c] == player
             and count < 5
         ):
@@ -265,8 +329,8 @@ class MoveGenerator:
         if count < 5:
             r, c = position.row - dy, position.col - dx
             while (
-                0 <= r < game.board.size
-                and 0 <= c < game.board.size
+                0 <= r < size
+                and 0 <= c < size
                 and board_array[r, c] == player
                 and count < 5
             ):
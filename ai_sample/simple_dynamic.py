@@ -1,12 +1,51 @@
 """Simple dynamic heuristic that learns from past player actions."""
 
 from typing import Dict, List, Tuple, Optional
-from collections import defaultdict, deque
+from collections import deque
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from gomoku.core.board import Player
 from gomoku.core.position import Position
 
 
+# Longest sequence whose packed key fits in an int64 (16 bits per move)
+_MAX_PACKED_LENGTH = 4
+
+# Entries kept in the weighted-score memo before it is reset
+_WEIGHTED_CACHE_SIZE = 4096
+
+# Slots in the sequence table (power of two) and slots probed per key
+SEQUENCE_TABLE_BITS = 16
+_MAX_PROBES = 8
+
+_KEY_LIMIT = 1 << 63
+_MERSENNE_61 = (1 << 61) - 1
+_FIB_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+
+def _packed_keys(moves: np.ndarray, length: int) -> np.ndarray:
+    """
+    Packed keys of every contiguous window of a move array.
+
+    Args:
+        moves: (N, 3) int64 array of (row, col, player)
+        length: Window length (at most _MAX_PACKED_LENGTH)
+
+    Returns:
+        (N - length + 1,) int64 array matching _encode_sequence for each window
+    """
+    windows = sliding_window_view(moves, (length, 3)).reshape(-1, length, 3)
+    rel = (windows[:, :, :2] - windows[:, :1, :2] + 31) & 0x3F
+    elems = rel[:, :, 0] << 8 | rel[:, :, 1] << 2 | windows[:, :, 2]
+    keys = np.zeros(len(windows), dtype=np.int64)
+    for i in range(length):
+        keys = keys << 16 | elems[:, i]
+    return keys
+
+
 class SimpleDynamicLearning:
     """Simple learning that tracks move sequences and their outcomes."""
     
@@ -18,9 +57,12 @@ class SimpleDynamicLearning:
             max_sequence_length: Maximum length of move sequences to track
         """
         self.max_sequence_length = max_sequence_length
-        self.sequence_scores: Dict[str, float] = defaultdict(float)
-        self.sequence_count: Dict[str, int] = defaultdict(int)
+        # Open-addressed table of learned sequences; key 0 marks an empty slot
+        self._keys = np.zeros(1 << SEQUENCE_TABLE_BITS, dtype=np.int64)
+        self._scores = np.zeros(1 << SEQUENCE_TABLE_BITS, dtype=np.float32)
+        self._counts = np.zeros(1 << SEQUENCE_TABLE_BITS, dtype=np.uint32)
         self.recent_games: deque = deque(maxlen=10)  # Keep last 10 games
+        self._weighted_cache: Dict[int, float] = {}  # key -> frequency-weighted score
     
     def learn_from_game(self, game_history: List[Tuple[Position, int]], winner: Optional[int]) -> None:
         """
@@ -41,8 +83,21 @@ class SimpleDynamicLearning:
     
     def _learn_from_sequences(self, game_history: List[Tuple[Position, int]], winner: int) -> None:
         """Learn from move sequences in the game."""
+        moves = np.array(
+            [(pos.row, pos.col, int(player)) for pos, player in game_history], dtype=np.int64
+        )
+
         # Learn from sequences of different lengths
         for length in range(2, min(len(game_history) + 1, self.max_sequence_length + 1)):
+            if length <= _MAX_PACKED_LENGTH:
+                windows = sliding_window_view(moves[:, 2], length)
+                keys = _packed_keys(moves, length).tolist()
+                winner_played = (windows == winner).any(axis=1).tolist()
+                # Same order as the scalar loop so the moving averages match
+                for sequence_key, success in zip(keys, winner_played):
+                    self._update_sequence_score(sequence_key, success)
+                continue
+
             for start in range(len(game_history) - length + 1):
                 sequence = game_history[start:start + length]
                 sequence_key = self._encode_sequence(sequence)
@@ -57,32 +112,95 @@ class SimpleDynamicLearning:
                     # This sequence was played by loser
                     self._update_sequence_score(sequence_key, False)
     
-    def _update_sequence_score(self, sequence_key: str, success: bool) -> None:
+    def _update_sequence_score(self, sequence_key: int, success: bool) -> None:
         """Update score for a move sequence."""
-        self.sequence_count[sequence_key] += 1
+        slot = self._claim_slot(sequence_key)
+        self._counts[slot] += 1
+        self._weighted_cache.pop(sequence_key, None)
         
         # Use exponential moving average
         alpha = 0.1  # Learning rate
-        current_score = self.sequence_scores[sequence_key]
+        current_score = float(self._scores[slot])
         new_score = 1.0 if success else 0.0
         
-        self.sequence_scores[sequence_key] = (1 - alpha) * current_score + alpha * new_score
+        self._scores[slot] = (1 - alpha) * current_score + alpha * new_score
+
+    @staticmethod
+    def _table_key(sequence_key: int) -> int:
+        """Fit a sequence key into the int64 table (keys over 4 moves are folded)."""
+        if sequence_key < _KEY_LIMIT:
+            return sequence_key
+        return sequence_key % _MERSENNE_61 or 1
+
+    @staticmethod
+    def _home_slot(table_key: int) -> int:
+        """First slot probed for a key (Fibonacci hashing spreads the packed bits)."""
+        return ((table_key * _FIB_MULTIPLIER) & _MASK64) >> (64 - SEQUENCE_TABLE_BITS)
+
+    def _find_slot(self, sequence_key: int) -> int:
+        """Slot holding a sequence, or -1 if it has not been learned."""
+        key = self._table_key(sequence_key)
+        mask = len(self._keys) - 1
+        slot = self._home_slot(key)
+        for _ in range(_MAX_PROBES):
+            stored = self._keys[slot]
+            if stored == key:
+                return slot
+            if stored == 0:
+                return -1
+            slot = (slot + 1) & mask
+        return -1
+
+    def _claim_slot(self, sequence_key: int) -> int:
+        """
+        Slot for updating a sequence, inserting it if needed.
+
+        When every probed slot holds another sequence, the least seen one is
+        replaced, which keeps the table at a fixed size across games.
+        """
+        key = self._table_key(sequence_key)
+        mask = len(self._keys) - 1
+        slot = self._home_slot(key)
+        victim = slot
+        for _ in range(_MAX_PROBES):
+            stored = self._keys[slot]
+            if stored == key:
+                return slot
+            if stored == 0:
+                victim = slot
+                break
+            if self._counts[slot] < self._counts[victim]:
+                victim = slot
+            slot = (slot + 1) & mask
+
+        if self._keys[victim] != 0:
+            self._weighted_cache.clear()
+        self._keys[victim] = key
+        self._scores[victim] = 0.0
+        self._counts[victim] = 0
+        return victim
     
-    def _encode_sequence(self, moves: List[Tuple[Position, int]]) -> str:
-        """Encode a sequence of moves as a string."""
+    def _encode_sequence(self, moves: List[Tuple[Position, int]]) -> int:
+        """
+        Encode a sequence of moves as a packed integer key.
+
+        Each move takes 16 bits: 6 bits per relative coordinate (offset by 31)
+        and 2 bits for the player. The first move is never zero, so sequences
+        of different lengths cannot collide.
+        """
         if not moves:
-            return ""
+            return 0
         
         # Create relative encoding (relative to first move)
         first_pos = moves[0][0]
-        encoded = []
+        key = 0
         
         for pos, player in moves:
             rel_row = pos.row - first_pos.row
             rel_col = pos.col - first_pos.col
-            encoded.append(f"{rel_row},{rel_col},{player}")
+            key = (key << 16) | ((rel_row + 31) & 0x3F) << 8 | ((rel_col + 31) & 0x3F) << 2 | player
         
-        return "|".join(encoded)
+        return key
     
     def get_sequence_score(self, moves: List[Tuple[Position, int]]) -> float:
         """
@@ -103,19 +221,28 @@ class SimpleDynamicLearning:
         for length in range(2, min(len(moves) + 1, self.max_sequence_length + 1)):
             for start in range(len(moves) - length + 1):
                 sequence = moves[start:start + length]
-                sequence_key = self._encode_sequence(sequence)
-                
-                if sequence_key in self.sequence_scores:
-                    score = self.sequence_scores[sequence_key]
-                    
-                    # Weight by frequency (more frequent = more reliable)
-                    count = self.sequence_count[sequence_key]
-                    frequency_weight = min(1.0, count / 3.0)  # Cap at 1.0
-                    score *= frequency_weight
-                    
-                    best_score = max(best_score, score)
+                best_score = max(best_score, self._weighted_score(self._encode_sequence(sequence)))
+
+                # Nothing can score above a fully weighted 1.0
+                if best_score >= 1.0:
+                    return best_score
         
         return best_score
+
+    def _weighted_score(self, sequence_key: int) -> float:
+        """Frequency-weighted score of one sequence, memoized until it is updated."""
+        score = self._weighted_cache.get(sequence_key)
+        if score is None:
+            slot = self._find_slot(sequence_key)
+            score = float(self._scores[slot]) if slot >= 0 else 0.0
+            if score:
+                # Weight by frequency (more frequent = more reliable)
+                count = int(self._counts[slot])
+                score *= min(1.0, count / 3.0)  # Cap at 1.0
+            if len(self._weighted_cache) >= _WEIGHTED_CACHE_SIZE:
+                self._weighted_cache.clear()
+            self._weighted_cache[sequence_key] = score
+        return score
     
     def get_game_phase(self, total_moves: int) -> str:
         """Determine game phase based on number of moves."""
@@ -0,0 +1,120 @@
+"""Transposition table in shared memory for parallel root search."""
+
+from typing import Optional, Tuple
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from gomoku.core.position import Position
+
+# Slots in the shared table (power of two)
+SHARED_TT_SIZE = 1 << 18
+
+_MASK64 = (1 << 64) - 1
+_PLAYER_MIX = 0x9E3779B97F4A7C15
+_CAPTURE_MIX = 0xC2B2AE3D27D4EB4F
+_NO_MOVE = 0xFFFF
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without handing it to this process's resource tracker."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedTranspositionTable:
+    """
+    Fixed-size, always-overwrite transposition table backed by shared memory.
+
+    Each slot holds three uint64 words: a check word, the score (float64
+    bits) and a packed (depth, flag, row, col) word. The check word is
+    key ^ score ^ meta, so a slot torn by two workers writing at once fails
+    validation and reads as a miss instead of returning a mixed entry.
+
+    Supports the subset of the dict interface the search uses: get(),
+    item assignment and clear(), with the same (hash, player, captures)
+    tuple keys and (depth, score, flag, best_move) values.
+    """
+
+    def __init__(self, size: int = SHARED_TT_SIZE, name: Optional[str] = None) -> None:
+        """
+        Create a new table, or attach to an existing one.
+
+        Args:
+            size: Number of slots (power of two); must match the creator's
+            name: Shared memory block to attach to (None = create)
+        """
+        nbytes = size * 3 * 8
+        if name is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+            self._owner = True
+        else:
+            self._shm = _attach(name)
+            self._owner = False
+        self._words = np.ndarray((size, 3), dtype=np.uint64, buffer=self._shm.buf)
+        self._scores = self._words.view(np.float64)[:, 1]
+        self._mask = size - 1
+        if self._owner:
+            self._words.fill(0)
+
+    @property
+    def name(self) -> str:
+        """Shared memory block name, for attaching from other processes."""
+        return self._shm.name
+
+    @staticmethod
+    def _key(tt_key: Tuple[int, int, int, int]) -> int:
+        """Fold a (hash, player, captures black, captures white) key into 64 bits."""
+        board_hash, player, captures_black, captures_white = tt_key
+        capture_code = (int(captures_black) << 8 | int(captures_white)) + 1
+        return (
+            int(board_hash) ^ (int(player) * _PLAYER_MIX) ^ (capture_code * _CAPTURE_MIX)
+        ) & _MASK64
+
+    def get(self, tt_key: Tuple[int, int, int, int]) -> Optional[Tuple[int, float, int, Optional[Position]]]:
+        """Entry for a position, or None on a miss."""
+        key = self._key(tt_key)
+        words = self._words[key & self._mask].copy()  # one snapshot of the slot
+        check, score_bits, meta = (int(word) for word in words)
+        if check ^ score_bits ^ meta != key or not meta:
+            return None
+
+        row, col = (meta >> 8) & 0xFF, meta & 0xFF
+        move = None if (meta & 0xFFFF) == _NO_MOVE else Position(row, col)
+        score = float(words.view(np.float64)[1])
+        return (meta >> 32) & 0xFF, score, (meta >> 24) & 0xFF, move
+
+    def __setitem__(
+        self, tt_key: Tuple[int, int, int, int], entry: Tuple[int, float, int, Optional[Position]]
+    ) -> None:
+        """Store an entry, overwriting whatever held the slot."""
+        depth, score, flag, move = entry
+        key = self._key(tt_key)
+        slot = key & self._mask
+
+        move_bits = _NO_MOVE if move is None else (move.row << 8 | move.col)
+        # Bit 40 keeps meta non-zero so an empty slot never validates
+        meta = 1 << 40 | (depth & 0xFF) << 32 | (flag & 0xFF) << 24 | move_bits
+
+        # Check word from this writer's own values, never from a re-read of the shared slot
+        score_bits = int(np.float64(score).view(np.uint64))
+        self._scores[slot] = score
+        self._words[slot, 2] = meta
+        self._words[slot, 0] = key ^ score_bits ^ meta
+
+    def clear(self) -> None:
+        """Empty every slot."""
+        self._words.fill(0)
+
+    def close(self) -> None:
+        """Detach from the block, and free it if this table created it."""
+        shm = getattr(self, "_shm", None)
+        if shm is None:
+            return
+        self._shm = None
+        self._words = self._scores = None
+        shm.close()
+        if self._owner:
+            shm.unlink()
@@ -1,12 +1,33 @@
 """Simple Zobrist-based pattern learning for dynamic heuristic."""
 
-import random
-from typing import Dict, Optional
-from collections import defaultdict
+import os
+import tempfile
+from typing import Optional
+import numpy as np
 
 from gomoku.core.board import Player
 from gomoku.core.position import Position
 
+# Optional Numba kernel for the learning update
+try:
+    from gomoku.ai._learning_numba import learn_position_numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Fixed seed, so every process builds the same keys and hashes match across workers
+ZOBRIST_SEED = 0x60B0C0
+
+# Generated keys are saved here and memory-mapped, so processes share one copy
+ZOBRIST_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "gomoku")
+
+# Slots in the learned-pattern table (power of two) and slots probed per hash
+PATTERN_TABLE_BITS = 16
+_MAX_PROBES = 8
+
+# Table key standing in for hash 0 (the empty board), since key 0 marks an empty slot
+_ZERO_HASH_KEY = (1 << 64) - 1
+
 
 class ZobristLearning:
     """Simple pattern learning using Zobrist hashing."""
@@ -19,21 +40,61 @@ class ZobristLearning:
             board_size: Size of the game board
         """
         self.board_size = board_size
-        self.pattern_scores: Dict[int, float] = defaultdict(float)  # hash -> score
-        self.pattern_frequency: Dict[int, int] = defaultdict(int)   # hash -> count
+        # Open-addressed table of learned positions; key 0 marks an empty slot
+        self._keys = np.zeros(1 << PATTERN_TABLE_BITS, dtype=np.uint64)
+        self._scores = np.zeros(1 << PATTERN_TABLE_BITS, dtype=np.float64)
+        self._counts = np.zeros(1 << PATTERN_TABLE_BITS, dtype=np.uint32)
         self._initialize_zobrist_table()
     
     def _initialize_zobrist_table(self) -> None:
-        """Initialize Zobrist hash table."""
-        # Create random numbers for each (position, player) combination
-        self.zobrist_table = {}
-        
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                for player in [Player.BLACK, Player.WHITE]:
-                    # Use position and player as key
-                    key = (row, col, player)
-                    self.zobrist_table[key] = random.getrandbits(64)
+        """
+        Initialize Zobrist hash table.
+        
+        The table is loaded read-only from the on-disk cache when present
+        (the OS shares its pages between processes). Otherwise it is
+        generated and saved for the next process. If the cache cannot be
+        written, the generated table is kept in memory.
+        """
+        shape = (self.board_size, self.board_size, 3)
+        path = os.path.join(ZOBRIST_CACHE_DIR, f"zobrist_{self.board_size}.npy")
+        try:
+            keys = np.load(path, mmap_mode="r")
+            if keys.shape == shape and keys.dtype == np.uint64:
+                self.zobrist_keys = keys
+                return
+        except (OSError, ValueError):
+            pass
+        
+        self.zobrist_keys = self._generate_zobrist_keys(shape)
+        try:
+            os.makedirs(ZOBRIST_CACHE_DIR, exist_ok=True)
+            # Write under a temporary name so a process never maps a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=ZOBRIST_CACHE_DIR, suffix=".npy")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, self.zobrist_keys)
+            os.replace(tmp_path, path)
+            tmp_path = None
+        except OSError:
+            pass
+        finally:
+            # Do not leave a partial temporary file behind in the cache directory
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+    
+    @staticmethod
+    def _generate_zobrist_keys(shape) -> np.ndarray:
+        """Random number for each (row, col, player) from the fixed seed; index 0 (EMPTY) stays 0."""
+        rng = np.random.default_rng(ZOBRIST_SEED)
+        keys = np.zeros(shape, dtype=np.uint64)
+        for player in [Player.BLACK, Player.WHITE]:
+            keys[:, :, int(player)] = rng.integers(0, 1 << 64, size=shape[:2], dtype=np.uint64)
+        return keys
     
     def get_board_hash(self, board_array) -> int:
         """
@@ -45,18 +106,91 @@ class ZobristLearning:
         Returns:
             Zobrist hash of board state
         """
-        board_hash = 0
-        actual_size = board_array.shape[0]  # Get actual board size
+        actual_size = min(board_array.shape[0], self.board_size)
+        cells = np.asarray(board_array[:actual_size, :actual_size])
         
-        for row in range(actual_size):
-            for col in range(actual_size):
-                if board_array[row, col] != Player.EMPTY:
-                    key = (row, col, int(board_array[row, col]))
-                    if key in self.zobrist_table:
-                        board_hash ^= self.zobrist_table[key]
+        # XOR-reduce the keys of every stone in one pass
+        rows, cols = np.nonzero(cells != Player.EMPTY)
+        keys = self.zobrist_keys[rows, cols, cells[rows, cols].astype(np.intp)]
+        return int(np.bitwise_xor.reduce(keys, initial=np.uint64(0)))
+    
+    def update_hash(self, board_hash: int, row: int, col: int, player: int) -> int:
+        """
+        Toggle one stone in a hash (XOR is its own inverse, so this both
+        places and removes the stone).
         
+        Args:
+            board_hash: Hash before the change
+            row, col: Cell that changed
+            player: Stone placed on / removed from the cell
+            
+        Returns:
+            Hash after the change
+        """
+        return board_hash ^ int(self.zobrist_keys[row, col, int(player)])
+    
+    def get_game_hash(self, game) -> int:
+        """
+        Get the running hash tracked on a search copy of a game.
+        
+        Games not created by the search (no tracked hash) are hashed from
+        scratch, since their board may have changed outside the search.
+        
+        Args:
+            game: Game instance
+            
+        Returns:
+            Zobrist hash of the game's board
+        """
+        board_hash = getattr(game, "zobrist_hash", None)
+        if board_hash is None:
+            board_hash = self.get_board_hash(game.board.to_array())
         return board_hash
     
+    def get_board_array(self, game) -> np.ndarray:
+        """
+        Get a C-contiguous int8 snapshot of the game's board.
+        
+        On search copies the snapshot is cached against the tracked hash,
+        so repeated calls for the same node share one array until the
+        next tracked move changes the hash. The returned array is shared
+        and must not be modified.
+        
+        Args:
+            game: Game instance
+            
+        Returns:
+            2D board array
+        """
+        board_hash = getattr(game, "zobrist_hash", None)
+        if board_hash is None:
+            return np.ascontiguousarray(game.board.to_array(), dtype=np.int8)
+        
+        cached = getattr(game, "board_array_cache", None)
+        if cached is not None and cached[0] == board_hash:
+            return cached[1]
+        
+        board_array = np.ascontiguousarray(game.board.to_array(), dtype=np.int8)
+        game.board_array_cache = (board_hash, board_array)
+        return board_array
+    
+    def track_move(self, game, parent_hash: int, position: Position, player: int, parent_captures: int) -> None:
+        """
+        Update the running hash on a game after a move was applied to it.
+        
+        Args:
+            game: Game the move was just made on
+            parent_hash: Hash of the position before the move
+            position: Position of the placed stone
+            player: Player who placed the stone
+            parent_captures: Total captured pairs before the move
+        """
+        if game.captures[Player.BLACK] + game.captures[Player.WHITE] != parent_captures:
+            # Captured stones are not reported by make_move; rehash lazily
+            game.zobrist_hash = None
+        else:
+            game.zobrist_hash = self.update_hash(parent_hash, position.row, position.col, player)
+    
     def learn_from_position(self, board_hash: int, score: float) -> None:
         """
         Learn from a board position and its evaluation.
@@ -65,13 +199,23 @@ class ZobristLearning:
             board_hash: Zobrist hash of the position
             score: Evaluation score of the position
         """
+        alpha = 0.1  # Learning rate
+        if NUMBA_AVAILABLE:
+            # Probe, insert and moving-average update in one compiled call
+            learn_position_numba(
+                self._keys, self._scores, self._counts,
+                np.uint64(board_hash or _ZERO_HASH_KEY), float(score), alpha, _MAX_PROBES,
+            )
+            return
+        
+        slot = self._claim_slot(board_hash)
+        
         # Update pattern frequency
-        self.pattern_frequency[board_hash] += 1
+        self._counts[slot] += 1
         
         # Update pattern score using exponential moving average
-        alpha = 0.1  # Learning rate
-        current_score = self.pattern_scores[board_hash]
-        self.pattern_scores[board_hash] = (1 - alpha) * current_score + alpha * score
+        current_score = float(self._scores[slot])
+        self._scores[slot] = (1 - alpha) * current_score + alpha * score
     
     def get_position_score(self, board_hash: int) -> float:
         """
@@ -83,39 +227,85 @@ class ZobristLearning:
         Returns:
             Learned score for the position
         """
-        if board_hash not in self.pattern_scores:
+        slot = self._find_slot(board_hash)
+        if slot < 0:
             return 0.0
         
         # Weight by frequency (more frequent = more reliable)
-        frequency = self.pattern_frequency[board_hash]
+        frequency = int(self._counts[slot])
         frequency_weight = min(1.0, frequency / 5.0)  # Cap at 1.0
         
-        return self.pattern_scores[board_hash] * frequency_weight
+        return float(self._scores[slot]) * frequency_weight
+    
+    def _find_slot(self, board_hash: int) -> int:
+        """Slot holding a position, or -1 if it has not been learned."""
+        key = board_hash or _ZERO_HASH_KEY
+        mask = len(self._keys) - 1
+        slot = key & mask  # Zobrist hashes are already uniform in their low bits
+        for _ in range(_MAX_PROBES):
+            stored = int(self._keys[slot])
+            if stored == key:
+                return slot
+            if stored == 0:
+                return -1
+            slot = (slot + 1) & mask
+        return -1
+    
+    def _claim_slot(self, board_hash: int) -> int:
+        """
+        Slot for updating a position, inserting it if needed.
+        
+        When every probed slot holds another position, the least seen one
+        is replaced, which keeps the table at a fixed size.
+        """
+        key = board_hash or _ZERO_HASH_KEY
+        mask = len(self._keys) - 1
+        slot = key & mask
+        victim = slot
+        for _ in range(_MAX_PROBES):
+            stored = int(self._keys[slot])
+            if stored == key:
+                return slot
+            if stored == 0:
+                victim = slot
+                break
+            if self._counts[slot] < self._counts[victim]:
+                victim = slot
+            slot = (slot + 1) & mask
+        
+        self._keys[victim] = key
+        self._scores[victim] = 0.0
+        self._counts[victim] = 0
+        return victim
     
     def clear_old_patterns(self, max_patterns: int = 1000) -> None:
         """Clear old patterns to prevent memory bloat."""
-        if len(self.pattern_scores) <= max_patterns:
+        occupied = np.flatnonzero(self._keys)
+        if len(occupied) <= max_patterns:
             return
         
-        # Keep only the most frequent patterns
-        sorted_patterns = sorted(
-            self.pattern_frequency.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )
-        
-        # Clear less frequent patterns
-        patterns_to_keep = {hash_val for hash_val, _ in sorted_patterns[:max_patterns]}
-        
-        self.pattern_scores = {
-            k: v for k, v in self.pattern_scores.items() 
-            if k in patterns_to_keep
-        }
-        self.pattern_frequency = {
-            k: v for k, v in self.pattern_frequency.items() 
-            if k in patterns_to_keep
-        }
+        # Keep only the most frequent patterns (partial selection, no full sort)
+        top = np.argpartition(self._counts[occupied], -max_patterns)[-max_patterns:]
+        keep = occupied[top]
+        keys, scores, counts = self._keys[keep], self._scores[keep], self._counts[keep]
+        
+        # Reinsert the survivors into an empty table, so no probe chain has gaps
+        self._keys.fill(0)
+        self._scores.fill(0.0)
+        self._counts.fill(0)
+        for key, score, count in zip(keys.tolist(), scores.tolist(), counts.tolist()):
+            slot = self._claim_slot(key)
+            self._scores[slot] = score
+            self._counts[slot] = count
+
+
+# Global learning instance, created on first use so importing the module stays cheap
+_instance: Optional[ZobristLearning] = None
 
 
-# Global learning instance
-zobrist_learner = ZobristLearning()
+def get_learner() -> ZobristLearning:
+    """Shared learning instance (created on first call)."""
+    global _instance
+    if _instance is None:
+        _instance = ZobristLearning()
+    return _instance
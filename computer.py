@@ -1,24 +1,105 @@
 import random
 import heapq
-from typing import List, Optional, Tuple
+import bisect
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+# 선택: numba가 있으면 후보 정렬·즉시 승리 판정을 후보 전체에 대해 한 번에 계산하는 커널 사용
+# (None: 아직 확인 전, 커널은 처음 쓸 때 _load_numba로 불러와 import computer를 가볍게 유지)
+NUMBA_AVAILABLE: Optional[bool] = None
+
+def _load_numba() -> bool:
+    """numba 커널을 처음 한 번만 불러오고 사용 가능 여부를 반환"""
+    global NUMBA_AVAILABLE, np, light_scores_numba, five_flags_numba
+    if NUMBA_AVAILABLE is None:
+        try:
+            import numpy as np
+            from _search_numba import light_scores_numba, five_flags_numba
+            NUMBA_AVAILABLE = True
+        except ImportError:
+            NUMBA_AVAILABLE = False
+    return NUMBA_AVAILABLE
+
+# 치환표 항목 종류: 정확한 값 / 하한(베타 컷) / 상한(알파 컷)
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+TT_MAX_SIZE = 1 << 18  # 치환표 최대 항목 수 (넘으면 비움)
+LINE_CACHE_MAX_SIZE = 1 << 16  # 줄 내용별 평가값 캐시 최대 항목 수 (넘으면 비움)
+OPENING_MAX_STONES = 2  # 돌이 이 수 이하인 초반 국면은 탐색 결과를 기억해 두고 다시 탐색하지 않음
+OPENING_MAX_SIZE = 1 << 10  # 초반 국면 수 표 최대 항목 수 (넘으면 비움)
+
+# 탐색용 보드 칸 값 (바이트): 빈 칸, 보드 바깥 경계
+EMPTY = ord(".")
+WALL = ord("#")
 
 class GomokuAI:
-    def __init__(self, color: str, lvl: int = 2):
+    _DIRS = ((1, 0), (0, 1), (1, 1), (1, -1))  # (dx, dy): 가로, 세로, 대각선, 역대각선
+
+    def __init__(self, color: str, lvl: int = 2, time_limit: Optional[float] = None,
+                 workers: Optional[int] = None):
         self.color = color # 'O' or 'X'
         self.opponent = "O" if color == "X" else "X"
         self.board_size = 0
         self.depth_limit = lvl
+        self.time_limit = time_limit  # 초 단위, 설정 시 반복 심화로 시간 안에서 가능한 깊이까지만 탐색
+        self.workers = workers  # 2 이상이면 (시간 제한이 없을 때) 루트 후보를 여러 프로세스에서 나눠 탐색
+        self.pool: Optional[ProcessPoolExecutor] = None  # 첫 병렬 탐색 때 만들어 이후 재사용
+        self.search_count = 0  # 작업 프로세스가 새 탐색인지 알아보고 치환표를 비우는 데 사용
+        # 탐색은 경계 칸으로 둘러싼 1차원 bytearray 보드에서 진행: (y, x) -> (y + 1) * stride + x
+        # 한 줄 끝의 경계 칸을 다음 줄과 공유하므로 stride = board_size + 1
+        self.stride = 1
+        self.steps: Tuple[int, ...] = ()  # 가로, 세로, 대각선, 역대각선 방향의 인덱스 간격
+        self.my_stone = ord(self.color)
+        self.opp_stone = ord(self.opponent)
+        self.zobrist_table: Dict[int, List[int]] = {}  # 돌 값 -> 칸 인덱스별 난수
+        # 해시 -> (남은 깊이, 항목 종류, 평가값, 최선 수 또는 None)
+        self.tt: Dict[int, Tuple[int, int, float, Optional[Tuple[int, int]]]] = {}
+        self.neighbors: List[Tuple[int, ...]] = []  # 칸 인덱스 -> 반경 2 이웃 칸 인덱스
+        self.cell_moves: List[Optional[Tuple[int, int]]] = []  # 칸 인덱스 -> (y, x) (경계 칸은 None), 후보 수 튜플을 새로 만들지 않고 재사용
+        # 증분 평가: 4방향의 모든 줄을 slice로 두고, 줄마다 (점수, 5목 여부)를 유지해 수를 둘 때 그 칸을 지나는 4줄만 갱신
+        self.lines: List[slice] = []
+        self.cell_lines: List[Tuple[int, ...]] = []  # 칸 인덱스 -> 지나는 줄 번호 4개
+        self.line_values: List[Tuple[int, bool]] = []
+        self.eval_score = 0  # 줄 점수 합 (_evaluate_local과 같은 값)
+        self.five_lines = 0  # 5목이 있는 줄 수
+        self.line_cache: Dict[bytes, Tuple[int, bool]] = {}  # 줄 내용 -> (점수, 5목 여부), 내 돌 기준
+        self.line_cache_stone = 0
+        # 비트보드: 돌 값 -> 그 색 돌이 있는 칸 인덱스를 비트로 모은 정수 (경계 칸 비트는 항상 0이라 이동해도 줄을 넘지 않음)
+        self.stone_bits: Dict[int, int] = {}
+        self.cell_bits = 0  # 보드 안 모든 칸의 비트 (빈 칸 비트 = cell_bits & ~(두 색 비트))
+        self.killers: Dict[int, List[Tuple[int, int]]] = {}  # 남은 깊이 -> 그 깊이에서 최근 컷을 낸 수 2개 (최근 것 먼저)
+        self.history: List[int] = []  # 칸 인덱스 -> 그 칸의 수가 컷을 낸 깊이 제곱의 합 (탐색마다 초기화)
+        self.stone_cells: List[int] = []  # 돌이 있는 칸 인덱스 (오름차순, 수를 둘 때마다 갱신)
+        # 초반 국면 수 표: (탐색 깊이, 보드 bytes) -> 결과 수, 처음 나올 때 탐색해서 채움
+        self._opening: Dict[Tuple[int, bytes], Tuple[int, int]] = {}
     
     def get_move(self, board: List[List[str]]) -> Optional[Tuple[int, int]]:
-        self.board_size = len(board)
+        if len(board) != self.board_size or not self.zobrist_table:
+            self._init_tables(len(board))
+        self.my_stone = ord(self.color)
+        self.opp_stone = ord(self.opponent)
+        self.tt.clear()
+        self.killers.clear()
+        board = self._to_buffer(board)
+        self.history = [0] * len(board)
+        self._reset_eval(board)
 
         candidates = self._get_candidates(board)
         if not candidates:
             c = self.board_size // 2
             return (c + 1, c + 1)
 
+        # 초반 국면은 같은 조건에서 이미 탐색한 적이 있으면 그 결과를 바로 사용
+        # (탐색 결과가 국면·깊이·색으로 정해지는 경우, 즉 시간 제한이 없을 때만)
+        opening_key = None
+        if self.time_limit is None and len(self.stone_cells) <= OPENING_MAX_STONES:
+            opening_key = (self.depth_limit, bytes(board))
+            move = self._opening.get(opening_key)
+            if move is not None:
+                return move
+
         # 1. 즉시 승리 수 체크 (내가 지금 두면 바로 이기는 수)
-        winning_move = self._find_winning_move(board, candidates, self.color)
+        winning_move = self._find_winning_move(board, candidates, self.my_stone)
         if winning_move:
             y, x = winning_move
             return (x + 1, y + 1)
@@ -32,35 +113,320 @@ class GomokuAI:
         # 후보를 정렬하여 좋은 수를 먼저 탐색 (상위 20개만 선택 - 최적화)
         candidates = self._sort_candidates(board, candidates, True, max_needed=20)
 
+        board_hash = self._hash_board(board)
+
+        if self.time_limit is None:
+            # 시간 제한이 없으면 목표 깊이로 바로 탐색 (이 깊이에서는 반복 심화가 노드만 늘림)
+            if self.workers and self.workers > 1 and len(candidates) > 1:
+                best_move = self._search_root_parallel(board, candidates, self.depth_limit, board_hash)
+            else:
+                best_move = self._search_root(board, candidates, self.depth_limit, board_hash)
+        else:
+            # 반복 심화: 얕은 깊이부터 탐색하고, 직전 깊이의 최선 수를 다음 깊이에서 가장 먼저 탐색
+            # 시간이 다 되면 마지막으로 끝낸 깊이의 최선 수를 사용
+            deadline = time.monotonic() + self.time_limit
+            best_move = None
+            for depth in range(1, self.depth_limit + 1):
+                best_move = self._search_root(board, candidates, depth, board_hash, best_move)
+                if time.monotonic() >= deadline:
+                    break
+        
+        y, x = best_move
+        if opening_key is not None:
+            if len(self._opening) >= OPENING_MAX_SIZE:
+                self._opening.clear()
+            self._opening[opening_key] = (x + 1, y + 1)
+        return (x + 1, y + 1)
+
+    def _search_root(self, board: bytearray, candidates: List[Tuple[int, int]], depth: int,
+                     board_hash: int, prev_best: Optional[Tuple[int, int]] = None) -> Tuple[int, int]:
+        """루트 후보들을 주어진 깊이로 탐색해 최선 수 반환 (prev_best를 맨 앞에서 탐색)"""
+        if prev_best is not None:
+            candidates = [prev_best] + [move for move in candidates if move != prev_best]
+
         best_move = candidates[0]
         best_score = float("-inf")
+        stride = self.stride
 
         # Minimax with alpha-beta pruning
+        # 루트도 최대화 노드이므로 지금까지의 최고 점수를 alpha로 넘겨, 정렬상 뒤쪽 수들이
+        # 그보다 나을 수 없다는 것만 확인되면 바로 잘리도록 함 (동점은 앞의 수를 유지)
+        keys = self.zobrist_table[self.my_stone]
         for move in candidates:
             y, x = move
-            board[y][x] = self.color
-            score = self._minimax(board, self.depth_limit - 1, False, float('-inf'), float('inf'))
-            board[y][x] = "."
+            i = (y + 1) * stride + x
+            saved = self._play(board, i, self.my_stone)
+            score = self._minimax(board, depth - 1, False, best_score, float('inf'), board_hash ^ keys[i])
+            self._undo(board, i, saved)
 
             if score > best_score:
                 best_score = score
                 best_move = move
         
+        return best_move
+
+    def _search_root_parallel(self, board: bytearray, candidates: List[Tuple[int, int]], depth: int,
+                              board_hash: int) -> Tuple[int, int]:
+        """첫 후보를 직접 탐색해 alpha를 정한 뒤, 나머지 후보를 프로세스 풀에서 나눠 탐색
+
+        나머지 후보는 모두 첫 후보의 점수를 alpha로 받으므로, 그보다 나은 수의 점수는 정확하고
+        아닌 수는 alpha 이하로 나옴. 후보 순서대로 더 높은 점수만 채택하면 _search_root와 같은 수가 선택됨
+        """
+        stride = self.stride
+        best_move = candidates[0]
         y, x = best_move
-        return (x + 1, y + 1)
+        i = (y + 1) * stride + x
+        saved = self._play(board, i, self.my_stone)
+        best_score = self._minimax(board, depth - 1, False, float('-inf'), float('inf'),
+                                   board_hash ^ self.zobrist_table[self.my_stone][i])
+        self._undo(board, i, saved)
+
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.search_count += 1
+        board_bytes = bytes(board)
+        futures = [
+            self.pool.submit(_search_root_child, board_bytes, self.board_size, self.color,
+                             move, depth, best_score, self.search_count)
+            for move in candidates[1:]
+        ]
+        for move, future in zip(candidates[1:], futures):
+            score = future.result()
+            if score > best_score:
+                best_score = score
+                best_move = move
+        return best_move
+
+    def __enter__(self) -> "GomokuAI":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """병렬 탐색용 프로세스 풀 종료 (__init__ 도중 실패한 객체에서 불려도 안전)"""
+        if getattr(self, "pool", None) is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def _init_tables(self, board_size: int) -> None:
+        """보드 크기에 맞는 인덱스 간격, Zobrist 난수, 이웃 칸 표 생성"""
+        self.board_size = board_size
+        self.stride = stride = board_size + 1
+        self.steps = tuple(dy * stride + dx for dx, dy in self._DIRS)
+        if _load_numba():
+            self.step_array = np.array(self.steps, dtype=np.int64)  # 커널에 넘길 방향 간격
+        cells = (board_size + 2) * stride
+
+        # 칸, 색마다 64비트 난수 (경계 칸 자리는 쓰이지 않음)
+        self.zobrist_table = {
+            ord(color): [random.getrandbits(64) for _ in range(cells)]
+            for color in ("O", "X")
+        }
+
+        # 칸마다 체비셰프 거리 2 이내의 보드 안 이웃 칸 목록 (거리 1 먼저)
+        offsets = [(dy, dx) for dy in range(-1, 2) for dx in range(-1, 2) if dy or dx]
+        offsets += [(dy, dx) for dy in range(-2, 3) for dx in range(-2, 3) if max(abs(dx), abs(dy)) == 2]
+        self.neighbors = [()] * cells
+        for y in range(board_size):
+            for x in range(board_size):
+                self.neighbors[(y + 1) * stride + x] = tuple(
+                    (y + dy + 1) * stride + x + dx
+                    for dy, dx in offsets
+                    if 0 <= y + dy < board_size and 0 <= x + dx < board_size
+                )
+
+        self.cell_moves = [None] * cells
+        for y in range(board_size):
+            for x in range(board_size):
+                self.cell_moves[(y + 1) * stride + x] = (y, x)
+
+        # 방향마다 보드 안에서 시작하는 줄을 모두 slice로 (길이 1인 줄은 점수가 없으므로 제외)
+        self.lines = []
+        cell_lines = [[] for _ in range(cells)]
+        for (dx, dy), step in zip(self._DIRS, self.steps):
+            for y in range(board_size):
+                for x in range(board_size):
+                    if 0 <= x - dx < board_size and 0 <= y - dy < board_size:
+                        continue  # 이전 칸이 보드 안이면 줄의 시작이 아님
+                    start = (y + 1) * stride + x
+                    line = [start]
+                    while 0 <= x + len(line) * dx < board_size and 0 <= y + len(line) * dy < board_size:
+                        line.append(line[-1] + step)
+                    if len(line) < 2:
+                        continue
+                    for i in line:
+                        cell_lines[i].append(len(self.lines))
+                    self.lines.append(slice(start, line[-1] + step, step))
+        self.cell_lines = [tuple(ids) for ids in cell_lines]
+        self.cell_bits = sum(1 << ((y + 1) * stride + x) for y in range(board_size) for x in range(board_size))
+
+    def _reset_eval(self, board: bytearray) -> None:
+        """탐색 시작 시 모든 줄의 평가값을 새로 계산"""
+        if self.line_cache_stone != self.my_stone:
+            self.line_cache.clear()
+            self.line_cache_stone = self.my_stone
+        self.line_values = [self._line_value(bytes(board[line])) for line in self.lines]
+        self.eval_score = sum(score for score, _ in self.line_values)
+        self.five_lines = sum(1 for _, five in self.line_values if five)
+        self.stone_bits = {self.my_stone: 0, self.opp_stone: 0}
+        self.stone_cells = []
+        for i, color in enumerate(board):
+            if color in self.stone_bits:
+                self.stone_bits[color] |= 1 << i
+                self.stone_cells.append(i)
+
+    def _play(self, board: bytearray, i: int, stone: int) -> Tuple[int, int, List[Tuple[int, Tuple[int, bool]]]]:
+        """돌을 두고 그 칸을 지나는 줄의 평가값만 갱신 (되돌리기용으로 이전 값 반환)"""
+        board[i] = stone
+        self.stone_bits[stone] ^= 1 << i
+        bisect.insort(self.stone_cells, i)
+        saved = (self.eval_score, self.five_lines, [])
+        line_values = self.line_values
+        for line_id in self.cell_lines[i]:
+            old = line_values[line_id]
+            new = self._line_value(bytes(board[self.lines[line_id]]))
+            line_values[line_id] = new
+            saved[2].append((line_id, old))
+            self.eval_score += new[0] - old[0]
+            self.five_lines += new[1] - old[1]
+        return saved
+
+    def _undo(self, board: bytearray, i: int, saved: Tuple[int, int, List[Tuple[int, Tuple[int, bool]]]]) -> None:
+        """_play로 둔 돌을 치우고 저장해 둔 줄 평가값을 그대로 복원"""
+        self.stone_bits[board[i]] ^= 1 << i
+        self.stone_cells.remove(i)
+        board[i] = EMPTY
+        self.eval_score, self.five_lines, old_values = saved
+        line_values = self.line_values
+        for line_id, old in old_values:
+            line_values[line_id] = old
+
+    def _five_starts(self, bits: int) -> int:
+        """비트보드에서 어느 방향으로든 5목이 시작되는 칸의 비트"""
+        starts = 0
+        for step in self.steps:
+            # 2칸, 4칸 연속을 차례로 겹쳐 5칸 연속 확인 (역대각선은 간격이 음수라 반대로 이동)
+            if step > 0:
+                pairs = bits & (bits >> step)
+                starts |= pairs & (pairs >> 2 * step) & (bits >> 4 * step)
+            else:
+                pairs = bits & (bits << -step)
+                starts |= pairs & (pairs << -2 * step) & (bits << -4 * step)
+        return starts
+
+    def _bitboard_winner(self) -> Optional[int]:
+        """비트보드로 5목 확인 (둘 다 있으면 전체 스캔처럼 앞쪽 칸에서 시작하는 쪽)"""
+        mine = self._five_starts(self.stone_bits[self.my_stone])
+        theirs = self._five_starts(self.stone_bits[self.opp_stone])
+        if mine and (not theirs or (mine & -mine) < (theirs & -theirs)):
+            return self.my_stone
+        if theirs:
+            return self.opp_stone
+        return None
+
+    def _line_value(self, line: bytes) -> Tuple[int, bool]:
+        """한 줄(진행 방향 순서의 칸들)에 대한 _evaluate_local 점수 합과 5목 여부 (줄 내용별 캐시)"""
+        value = self.line_cache.get(line)
+        if value is not None:
+            return value
+
+        # 양 끝에 경계 칸을 붙여 _evaluate_local과 같은 방식으로 돌마다 앞뒤를 확인
+        cells = b"#" + line + b"#"
+        my_stone = self.my_stone
+        score = 0
+        five = False
+        for i in range(1, len(cells) - 1):
+            color = cells[i]
+            if color == EMPTY:
+                continue
+            is_my_color = (color == my_stone)
+
+            count = 1
+            forward = i + 1
+            check_count = 0
+            while check_count < 4 and cells[forward] == color:
+                count += 1
+                forward += 1
+                check_count += 1
+
+            backward = i - 1
+            check_count = 0
+            while check_count < 4 and cells[backward] == color:
+                count += 1
+                backward -= 1
+                check_count += 1
+
+            if count >= 5:
+                five = True
+            elif count == 4:
+                forward_open = (cells[forward] == EMPTY) if check_count < 4 else False
+                backward_open = (cells[backward + 1] == EMPTY) if check_count < 4 else False
+
+                if forward_open and backward_open:
+                    score += 10000 if is_my_color else -10000
+                elif forward_open or backward_open:
+                    score += 1000 if is_my_color else -1000
+            elif count == 3:
+                score += 100 if is_my_color else -100
+            elif count == 2:
+                score += 10 if is_my_color else -10
+
+        if len(self.line_cache) >= LINE_CACHE_MAX_SIZE:
+            self.line_cache.clear()
+        value = (score, five)
+        self.line_cache[line] = value
+        return value
+
+    def _to_buffer(self, board: List[List[str]]) -> bytearray:
+        """입력 보드를 경계 칸으로 둘러싼 1차원 bytearray로 변환 (칸 값은 '.', 'O', 'X'의 바이트)"""
+        wall = "#" * self.stride
+        rows = "".join("".join(row) + "#" for row in board)
+        return bytearray((wall + rows + wall).encode())
+
+    def _hash_board(self, board: bytearray) -> int:
+        """보드 전체의 Zobrist 해시 계산 (탐색 시작 시 한 번만 사용)"""
+        board_hash = 0
+        for i, cell in enumerate(board):
+            if cell != EMPTY and cell != WALL:
+                board_hash ^= self.zobrist_table[cell][i]
+        return board_hash
 
-    def _minimax(self, board: List[List[str]], depth: int, is_maximizing: bool, alpha: float, beta: float) -> float:
-        # 승리 체크 (깊이와 관계없이)
-        winner = self._check_winner(board)
-        if winner == self.color:
+    def _minimax(self, board: bytearray, depth: int, is_maximizing: bool, alpha: float, beta: float,
+                 board_hash: int) -> float:
+        # 같은 국면을 같은 깊이로 평가한 적이 있으면 재사용
+        # (돌 수로 차례가 정해지므로 해시만으로 키를 삼고, 점수가 깊이에 따라 달라지므로 깊이는 일치해야 함)
+        entry = self.tt.get(board_hash)
+        if entry is not None and entry[0] == depth:
+            _, flag, value, _ = entry
+            if flag == TT_EXACT:
+                return value
+            if flag == TT_LOWER and value >= beta:
+                return value  # 이미 베타 이상임이 확인됨
+            if flag == TT_UPPER and value <= alpha:
+                return value  # 이미 알파 이하임이 확인됨
+
+        if len(self.tt) >= TT_MAX_SIZE:
+            self.tt.clear()
+
+        # 승리 체크 (깊이와 관계없이, 수를 둘 때마다 갱신한 비트보드 사용)
+        winner = self._bitboard_winner()
+        if winner == self.my_stone:
+            self.tt[board_hash] = (depth, TT_EXACT, 1000000 - depth, None)
             return 1000000 - depth  # 빠르게 승리할수록 높은 점수
-        elif winner == self.opponent:
+        elif winner == self.opp_stone:
+            self.tt[board_hash] = (depth, TT_EXACT, -1000000 + depth, None)
             return -1000000 + depth  # 상대가 빠르게 승리할수록 낮은 점수
         
         # 기저 조건: 깊이 도달
         if depth == 0:
-            # 로컬 평가 사용 (전판 스캔 대신)
-            return self._evaluate_local(board)
+            # 로컬 평가 사용 (수를 둘 때마다 갱신한 줄 점수 합, 5목이 있으면 원래대로 전판 평가)
+            score = self.eval_score if not self.five_lines else self._evaluate_local(board)
+            self.tt[board_hash] = (depth, TT_EXACT, score, None)
+            return score
 
         candidates = self._get_candidates(board)
         if not candidates:
@@ -72,16 +438,41 @@ class GomokuAI:
         # 후보를 점수 순으로 정렬 (상위 K개만 선택 - 최적화)
         candidates = self._sort_candidates(board, candidates, is_maximizing, max_needed=max_candidates * 2)
         
+        stride = self.stride
+        # 후보마다 둘 차례인 쪽이 두면 5목인지(비트 1), 상대가 두면 5목인지(비트 2) 판정
+        to_move, opp_to_move = (self.my_stone, self.opp_stone) if is_maximizing else (self.opp_stone, self.my_stone)
+        if NUMBA_AVAILABLE:
+            # 후보 전체를 커널 한 번으로 판정
+            fives = five_flags_numba(
+                np.frombuffer(board, dtype=np.uint8),
+                np.array([(y + 1) * stride + x for y, x in candidates], dtype=np.int64),
+                to_move, opp_to_move, self.step_array,
+            ).tolist()
+        else:
+            fives = []
+            for y, x in candidates:
+                i = (y + 1) * stride + x
+                board[i] = to_move
+                flag = 1 if self._check_winner(board, i) is not None else 0
+                # 상대가 다음 수에 이기는 수인지 확인
+                board[i] = opp_to_move
+                if self._check_winner(board, i) is not None:
+                    flag |= 2
+                board[i] = EMPTY
+                fives.append(flag)
+
+        # 바로 5목을 만드는 수가 있으면 그 수만 탐색 (가장 빠른 승리라 다른 수가 더 나을 수 없음)
+        for move, flag in zip(candidates, fives):
+            if flag & 1:
+                candidates = [move]
+                fives = [0]
+                break
+
         # 즉시 위협 차단 후보 분리 (컷에서 제외)
         critical_moves = []
         regular_moves = []
-        for move in candidates:
-            y, x = move
-            # 상대가 다음 수에 이기는 수인지 확인
-            board[y][x] = self.opponent if is_maximizing else self.color
-            winner = self._check_winner(board, (y, x))
-            board[y][x] = "."
-            if winner:
+        for move, flag in zip(candidates, fives):
+            if flag & 2:
                 critical_moves.append(move)
             else:
                 regular_moves.append(move)
@@ -89,52 +480,130 @@ class GomokuAI:
         # 즉시 위협 차단 후보는 항상 포함
         if len(regular_moves) > max_candidates - len(critical_moves):
             regular_moves = regular_moves[:max_candidates - len(critical_moves)]
+
+        # 컷을 자주 낸 수(히스토리 점수)를 먼저 탐색 (안정 정렬이라 점수가 같으면 패턴 점수 순서 유지)
+        history = self.history
+        regular_moves.sort(key=lambda move: -history[(move[0] + 1) * stride + move[1]])
         candidates = critical_moves + regular_moves
 
+        # 같은 깊이의 다른 노드에서 컷을 낸 수(킬러 수)를 앞쪽에서 탐색
+        killers = self.killers.get(depth)
+        if killers is not None:
+            for killer in reversed(killers):
+                if killer in candidates:
+                    candidates.remove(killer)
+                    candidates.insert(0, killer)
+
+        # 치환표에 남은 이 국면의 최선 수(창이 맞지 않아 값은 못 쓴 경우)를 가장 먼저 탐색
+        if entry is not None and entry[3] in candidates:
+            tt_move = entry[3]
+            candidates.remove(tt_move)
+            candidates.insert(0, tt_move)
+
+        # 창 안쪽 값만 정확한 값이므로 원래 창을 기억 (창 밖 값은 상한/하한으로 저장)
+        orig_alpha, orig_beta = alpha, beta
+
         if is_maximizing:
+            stone = self.my_stone
+            keys = self.zobrist_table[stone]
             max_eval = float('-inf')
+            best_move = None
             for y, x in candidates:
-                board[y][x] = self.color
-                eval = self._minimax(board, depth - 1, False, alpha, beta)
-                board[y][x] = "."
-                max_eval = max(max_eval, eval)
-                alpha = max(alpha, max_eval)  # 버그 수정: max_eval 사용
+                i = (y + 1) * stride + x
+                saved = self._play(board, i, stone)
+                if self.five_lines:
+                    # 방금 둔 돌로 5목 완성: 자식을 탐색하지 않고 가장 빠른 승리 점수로 종료 (이보다 좋은 수는 없음)
+                    self._undo(board, i, saved)
+                    max_eval = 1000000 - (depth - 1)
+                    best_move = (y, x)
+                    break
+                eval = self._minimax(board, depth - 1, False, alpha, beta, board_hash ^ keys[i])
+                self._undo(board, i, saved)
+                # 내장 max() 호출 대신 직접 비교 (자식 노드마다 함수 호출 두 번 절약)
+                if eval > max_eval:
+                    max_eval = eval
+                    best_move = (y, x)
+                    if eval > alpha:
+                        alpha = eval
                 if beta <= alpha:
+                    self._record_cutoff(depth, (y, x), i)
                     break
+            self._store_tt(board_hash, depth, max_eval, orig_alpha, orig_beta, best_move)
             return max_eval
         else:
+            stone = self.opp_stone
+            keys = self.zobrist_table[stone]
             min_eval = float('inf')
+            best_move = None
             for y, x in candidates:
-                board[y][x] = self.opponent
-                eval = self._minimax(board, depth - 1, True, alpha, beta)
-                board[y][x] = "."
-                min_eval = min(min_eval, eval)
-                beta = min(beta, min_eval)  # 버그 수정: min_eval 사용
+                i = (y + 1) * stride + x
+                saved = self._play(board, i, stone)
+                if self.five_lines:
+                    # 상대가 5목 완성: 가장 빠른 패배 점수로 종료
+                    self._undo(board, i, saved)
+                    min_eval = -1000000 + (depth - 1)
+                    best_move = (y, x)
+                    break
+                eval = self._minimax(board, depth - 1, True, alpha, beta, board_hash ^ keys[i])
+                self._undo(board, i, saved)
+                # 내장 min() 호출 대신 직접 비교
+                if eval < min_eval:
+                    min_eval = eval
+                    best_move = (y, x)
+                    if eval < beta:
+                        beta = eval
                 if beta <= alpha:
+                    self._record_cutoff(depth, (y, x), i)
                     break
+            self._store_tt(board_hash, depth, min_eval, orig_alpha, orig_beta, best_move)
             return min_eval
 
-    def _find_winning_move(self, board: List[List[str]], candidates: List[Tuple[int, int]], color: str) -> Optional[Tuple[int, int]]:
+    def _record_cutoff(self, depth: int, move: Tuple[int, int], i: int) -> None:
+        """컷을 낸 수를 그 깊이의 킬러 수 (2개 유지)와 히스토리 점수에 반영"""
+        killers = self.killers.get(depth)
+        if killers is None:
+            self.killers[depth] = [move]
+        elif killers[0] != move:
+            self.killers[depth] = [move, killers[0]]
+        self.history[i] += depth * depth
+
+    def _store_tt(self, board_hash: int, depth: int, value: float, alpha: float, beta: float,
+                  best_move: Optional[Tuple[int, int]]) -> None:
+        """탐색 창 (alpha, beta)에 대한 결과를 정확한 값/하한/상한으로 구분해 치환표에 저장"""
+        if value <= alpha:
+            flag = TT_UPPER
+        elif value >= beta:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        self.tt[board_hash] = (depth, flag, value, best_move)
+
+    def _find_winning_move(self, board: bytearray, candidates: List[Tuple[int, int]], color: int) -> Optional[Tuple[int, int]]:
         """즉시 승리 수 찾기 (내가 지금 두면 바로 이기는 수)"""
+        stride = self.stride
         for move in candidates:
             y, x = move
-            board[y][x] = color
-            winner = self._check_winner(board, (y, x))  # 마지막 수 기준 최적화
-            board[y][x] = "."
+            i = (y + 1) * stride + x
+            board[i] = color
+            winner = self._check_winner(board, i)  # 마지막 수 기준 최적화
+            board[i] = EMPTY
             if winner == color:
                 return move
         return None
     
-    def _find_blocking_move(self, board: List[List[str]], candidates: List[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+    def _find_blocking_move(self, board: bytearray, candidates: List[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
         """즉시 방어 수 찾기 (상대가 다음 수에 이기는 수를 막는 수)"""
+        stride = self.stride
+        opponent = self.opp_stone
         # 상대가 다음 수에 이기는 수 찾기
         opponent_threats = []
         for move in candidates:
             y, x = move
-            board[y][x] = self.opponent
-            winner = self._check_winner(board, (y, x))  # 마지막 수 기준 최적화
-            board[y][x] = "."
-            if winner == self.opponent:
+            i = (y + 1) * stride + x
+            board[i] = opponent
+            winner = self._check_winner(board, i)  # 마지막 수 기준 최적화
+            board[i] = EMPTY
+            if winner == opponent:
                 opponent_threats.append(move)
         
         # 상대의 위협이 있으면 막기
@@ -144,157 +613,121 @@ class GomokuAI:
             return opponent_threats[0]
         
         # 상대가 열린 4를 만들 수 있는 수 찾기 (다음 수에 승리 가능)
+        opp_bits = self.stone_bits[opponent]
+        empty_bits = self.cell_bits & ~(opp_bits | self.stone_bits[self.my_stone])
         for move in candidates:
             y, x = move
-            board[y][x] = self.opponent
-            # 열린 4가 있는지 확인
-            if self._has_open_four(board, self.opponent):
-                board[y][x] = "."
+            bit = 1 << ((y + 1) * stride + x)
+            # 그 칸에 상대 돌을 둔 비트보드로 열린 4가 있는지 확인
+            if self._has_open_four(opp_bits | bit, empty_bits & ~bit):
                 return move
-            board[y][x] = "."
         
         # 상대가 닫힌 4(반열린 4)를 만들 수 있는 수 찾기
-        closed_four_moves = self._find_closed_four_moves(board, candidates, self.opponent)
+        closed_four_moves = self._find_closed_four_moves(board, candidates, opponent)
         if closed_four_moves:
             return closed_four_moves[0]
         
         # 상대가 띄워진 4(broken four)를 만들 수 있는 수 찾기
-        broken_four_moves = self._find_broken_four_moves(board, candidates, self.opponent)
+        broken_four_moves = self._find_broken_four_moves(board, candidates, opponent)
         if broken_four_moves:
             return broken_four_moves[0]
         
         return None
     
-    def _has_open_four(self, board: List[List[str]], color: str) -> bool:
-        """열린 4가 있는지 확인 (양쪽이 모두 열린 4)"""
-        directions = [(1, 0), (0, 1), (1, 1), (1, -1)]
-        
-        for y in range(self.board_size):
-            for x in range(self.board_size):
-                if board[y][x] != color:
-                    continue
-                
-                for dx, dy in directions:
-                    # 이 방향으로 연속된 돌 개수 확인
-                    count = 1
-                    # 앞쪽으로 연속 확인
-                    nx, ny = x + dx, y + dy
-                    while (0 <= nx < self.board_size and 0 <= ny < self.board_size and 
-                           board[ny][nx] == color):
-                        count += 1
-                        nx += dx
-                        ny += dy
-                    
-                    # 뒤쪽으로 연속 확인
-                    back_x, back_y = x - dx, y - dy
-                    while (0 <= back_x < self.board_size and 
-                           0 <= back_y < self.board_size and 
-                           board[back_y][back_x] == color):
-                        count += 1
-                        back_x -= dx
-                        back_y -= dy
-                    
-                    # 4개 연속이고 양쪽이 모두 열려있는지 확인
-                    if count == 4:
-                        # 앞쪽 끝 확인 (while이 끝난 후 nx, ny는 첫 비-color 칸)
-                        forward_open = (0 <= nx < self.board_size and 0 <= ny < self.board_size and 
-                                       board[ny][nx] == ".")
-                        # 뒤쪽 끝 확인 (while이 끝난 후 back_x, back_y는 첫 비-color 칸)
-                        backward_open = (0 <= back_x < self.board_size and 0 <= back_y < self.board_size and 
-                                        board[back_y][back_x] == ".")
-                        
-                        if forward_open and backward_open:
-                            return True
-        
+    def _has_open_four(self, stones: int, empty: int) -> bool:
+        """열린 4가 있는지 비트보드로 확인 (정확히 4개 연속이고 양쪽 끝이 모두 빈 칸)"""
+        for step in self.steps:
+            # 4칸 연속이 시작되는 칸 중 바로 앞 칸과 4칸 뒤 칸이 빈 칸인 것 (역대각선은 간격이 음수라 반대로 이동)
+            if step > 0:
+                pairs = stones & (stones >> step)
+                fours = pairs & (pairs >> 2 * step)
+                if fours & (empty << step) & (empty >> 4 * step):
+                    return True
+            else:
+                pairs = stones & (stones << -step)
+                fours = pairs & (pairs << -2 * step)
+                if fours & (empty >> -step) & (empty << -4 * step):
+                    return True
         return False
     
-    def _find_closed_four_moves(self, board: List[List[str]], candidates: List[Tuple[int, int]], color: str) -> List[Tuple[int, int]]:
+    def _run(self, board: bytearray, i: int, step: int, color: int) -> Tuple[int, int, int]:
+        """i를 지나는 한 방향의 color 연속 길이 (i 포함)와 양쪽 끝 다음 칸 인덱스 (앞쪽, 뒤쪽)"""
+        count = 1
+        forward = i + step
+        while board[forward] == color:
+            count += 1
+            forward += step
+        backward = i - step
+        while board[backward] == color:
+            count += 1
+            backward -= step
+        return count, forward, backward
+
+    def _find_closed_four_moves(self, board: bytearray, candidates: List[Tuple[int, int]], color: int) -> List[Tuple[int, int]]:
         """닫힌 4(반열린 4)를 만들 수 있는 수 찾기"""
         closed_four_moves = []
-        directions = [(1, 0), (0, 1), (1, 1), (1, -1)]
+        stride = self.stride
+        steps = self.steps
         
         for move in candidates:
             y, x = move
-            board[y][x] = color
+            i = (y + 1) * stride + x
+            board[i] = color
             
-            for dx, dy in directions:
-                count = 1
-                # 앞쪽으로 연속 확인
-                nx, ny = x + dx, y + dy
-                while (0 <= nx < self.board_size and 0 <= ny < self.board_size and 
-                       board[ny][nx] == color):
-                    count += 1
-                    nx += dx
-                    ny += dy
-                
-                # 뒤쪽으로 연속 확인
-                back_x, back_y = x - dx, y - dy
-                while (0 <= back_x < self.board_size and 
-                       0 <= back_y < self.board_size and 
-                       board[back_y][back_x] == color):
-                    count += 1
-                    back_x -= dx
-                    back_y -= dy
+            for step in steps:
+                count, forward, backward = self._run(board, i, step, color)
                 
                 # 4개 연속이고 한쪽만 열려있는지 확인 (반열린 4)
                 if count == 4:
-                    forward_open = (0 <= nx < self.board_size and 0 <= ny < self.board_size and 
-                                   board[ny][nx] == ".")
-                    backward_open = (0 <= back_x < self.board_size and 0 <= back_y < self.board_size and 
-                                    board[back_y][back_x] == ".")
+                    forward_open = board[forward] == EMPTY
+                    backward_open = board[backward] == EMPTY
                     
                     # 한쪽만 열려있으면 닫힌 4 (반열린 4)
-                    if (forward_open and not backward_open) or (not forward_open and backward_open):
+                    if forward_open != backward_open:
                         closed_four_moves.append(move)
                         break
             
-            board[y][x] = "."
+            board[i] = EMPTY
         
         return closed_four_moves
     
-    def _find_broken_four_moves(self, board: List[List[str]], candidates: List[Tuple[int, int]], color: str) -> List[Tuple[int, int]]:
+    def _find_broken_four_moves(self, board: bytearray, candidates: List[Tuple[int, int]], color: int) -> List[Tuple[int, int]]:
         """띄워진 4(broken four)를 만들 수 있는 수 찾기"""
         broken_four_moves = []
-        directions = [(1, 0), (0, 1), (1, 1), (1, -1)]
+        stride = self.stride
+        steps = self.steps
         
         for move in candidates:
             y, x = move
-            board[y][x] = color
+            i = (y + 1) * stride + x
+            board[i] = color
             
-            for dx, dy in directions:
+            for step in steps:
                 # 윈도우 방식으로 띄워진 4 확인 (예: X X . X X 또는 X . X X X)
-                # 현재 위치를 중심으로 양쪽 확인
+                # 현재 위치를 중심으로 양쪽 확인 (경계 칸은 돌도 빈 칸도 아니므로 거기서 멈춤)
                 left_count = 0
                 right_count = 0
                 gap_pos = None
                 
                 # 왼쪽으로 확인
-                for i in range(1, 5):
-                    check_x = x - i * dx
-                    check_y = y - i * dy
-                    if (0 <= check_x < self.board_size and 0 <= check_y < self.board_size):
-                        if board[check_y][check_x] == color:
-                            left_count += 1
-                        elif board[check_y][check_x] == "." and gap_pos is None:
-                            gap_pos = i
-                            break
-                        else:
-                            break
+                for k in range(1, 5):
+                    cell = board[i - k * step]
+                    if cell == color:
+                        left_count += 1
+                    elif cell == EMPTY and gap_pos is None:
+                        gap_pos = k
+                        break
                     else:
                         break
                 
                 # 오른쪽으로 확인
-                for i in range(1, 5):
-                    check_x = x + i * dx
-                    check_y = y + i * dy
-                    if (0 <= check_x < self.board_size and 0 <= check_y < self.board_size):
-                        if board[check_y][check_x] == color:
-                            right_count += 1
-                        elif board[check_y][check_x] == "." and gap_pos is None:
-                            gap_pos = -i
-                            break
-                        else:
-                            break
+                for k in range(1, 5):
+                    cell = board[i + k * step]
+                    if cell == color:
+                        right_count += 1
+                    elif cell == EMPTY and gap_pos is None:
+                        gap_pos = -k
+                        break
                     else:
                         break
                 
@@ -304,99 +737,26 @@ class GomokuAI:
                     broken_four_moves.append(move)
                     break
             
-            board[y][x] = "."
+            board[i] = EMPTY
         
         return broken_four_moves
 
-    def _get_candidates(self, board: List[List[str]]) -> List[Tuple[int, int]]:
-        """비어있는 칸 중 기존 돌의 인접한 구역과 전술적으로 중요한 위치 탐색"""
-        candidates = set()
-        directions = [(1, 0), (0, 1), (1, 1), (1, -1)]  # 가로, 세로, 대각선, 역대각선
-        
-        # 기본 후보: 기존 돌 주변 반경 2까지 (8방향 + 대각선 중간)
-        for y in range(self.board_size):
-            for x in range(self.board_size):
-                if board[y][x] != ".":
-                    # 거리 1: 8방향
-                    for dy in range(-1, 2):
-                        for dx in range(-1, 2):
-                            if dx == 0 and dy == 0:
-                                continue
-                            ny, nx = y + dy, x + dx
-                            if 0 <= ny < self.board_size and 0 <= nx < self.board_size and board[ny][nx] == ".":
-                                candidates.add((ny, nx))
-                    # 거리 2: 체비셰프 거리 2인 모든 위치 확인 (대각선 포함)
-                    for dy in range(-2, 3):
-                        for dx in range(-2, 3):
-                            if dx == 0 and dy == 0:
-                                continue
-                            # 거리 1은 이미 처리했으므로 거리 2만 확인 (체비셰프 거리 2)
-                            chebyshev_dist = max(abs(dx), abs(dy))
-                            if chebyshev_dist == 2:
-                                ny, nx = y + dy, x + dx
-                                if 0 <= ny < self.board_size and 0 <= nx < self.board_size and board[ny][nx] == ".":
-                                    candidates.add((ny, nx))
-        
-        # 전술 후보: 4를 만들 수 있는 위치 (3이 있고 양쪽이 열린 경우)
-        tactical_candidates = self._get_tactical_candidates(board, directions)
-        candidates.update(tactical_candidates)
-        
-        return list(candidates)
-    
-    def _get_tactical_candidates(self, board: List[List[str]], directions: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
-        """전술적으로 중요한 위치 찾기 (3 연속 + 양끝 열림만 - 강한 조건만 유지)"""
-        tactical = set()
-        
-        # 내 돌과 상대 돌 모두 확인
-        for color in [self.color, self.opponent]:
-            for y in range(self.board_size):
-                for x in range(self.board_size):
-                    if board[y][x] != color:
-                        continue
-                    
-                    for dx, dy in directions:
-                        # 현재 위치에서 이 방향으로 연속된 돌 개수 확인
-                        count = 1
-                        # 앞쪽으로 연속 확인
-                        nx, ny = x + dx, y + dy
-                        while (0 <= nx < self.board_size and 0 <= ny < self.board_size and 
-                               board[ny][nx] == color):
-                            count += 1
-                            nx += dx
-                            ny += dy
-                        
-                        # 뒤쪽으로 연속 확인
-                        back_x, back_y = x - dx, y - dy
-                        while (0 <= back_x < self.board_size and 
-                               0 <= back_y < self.board_size and 
-                               board[back_y][back_x] == color):
-                            count += 1
-                            back_x -= dx
-                            back_y -= dy
-                        
-                        # 3개 연속이고 양쪽이 모두 열려있으면 4를 만들 수 있는 위치 추가 (강한 조건만)
-                        if count == 3:
-                            # 앞쪽 끝 확인 (보드 밖이면 닫힌 끝)
-                            if (nx < 0 or nx >= self.board_size or 
-                                ny < 0 or ny >= self.board_size):
-                                forward_open = False
-                            else:
-                                forward_open = (board[ny][nx] == ".")
-                            
-                            # 뒤쪽 끝 확인 (보드 밖이면 닫힌 끝)
-                            if (back_x < 0 or back_x >= self.board_size or 
-                                back_y < 0 or back_y >= self.board_size):
-                                backward_open = False
-                            else:
-                                backward_open = (board[back_y][back_x] == ".")
-                            
-                            # 양쪽이 모두 열려있을 때만 추가 (강한 조건)
-                            if forward_open and backward_open:
-                                # 양쪽 끝 모두 후보에 추가
-                                tactical.add((ny, nx))
-                                tactical.add((back_y, back_x))
-        
-        return list(tactical)
+    def _get_candidates(self, board: bytearray) -> List[Tuple[int, int]]:
+        """비어있는 칸 중 기존 돌의 인접한 구역 탐색
+
+        전술 후보(양쪽이 열린 3의 양 끝 빈 칸)는 돌 바로 옆 칸이라 항상 이 구역에 포함되므로 따로 찾지 않음
+        """
+        cells = set()
+        neighbors = self.neighbors
+        
+        # 기본 후보: 기존 돌 주변 반경 2까지 (미리 계산한 이웃 표 사용)
+        # 보드 전체를 훑지 않고 수를 둘 때마다 갱신하는 돌 목록만 확인, 칸 인덱스(정수)로 모은 뒤 빈 칸만 남김
+        for i in self.stone_cells:
+            cells.update(neighbors[i])
+        
+        # 칸 인덱스 순서(= (y, x) 순서)로 반환해 정렬 동점 순서가 집합 내부 순서에 좌우되지 않게 함
+        cell_moves = self.cell_moves
+        return [cell_moves[i] for i in sorted(cells) if board[i] == EMPTY]
     
     def _get_max_candidates_for_depth(self, depth: int) -> int:
         """깊이에 따라 최대 후보 수 반환 (깊을수록 더 적게, 방어 수 고려)"""
@@ -409,53 +769,74 @@ class GomokuAI:
         else:
             return 20  # 기본값
     
-    def _sort_candidates(self, board: List[List[str]], candidates: List[Tuple[int, int]], is_maximizing: bool, max_needed: Optional[int] = None) -> List[Tuple[int, int]]:
+    def _sort_candidates(self, board: bytearray, candidates: List[Tuple[int, int]], is_maximizing: bool, max_needed: Optional[int] = None) -> List[Tuple[int, int]]:
         """후보를 가벼운 패턴 점수 순으로 정렬 (최적화: 상위 K개만 선택 가능)"""
+        color_to_play = self.my_stone if is_maximizing else self.opp_stone
+        stride = self.stride
+
+        # 상위 K개 선택은 (점수, 칸 인덱스)를 정수 키 하나(점수 * span + 인덱스)로 합쳐서 비교
+        # 칸 인덱스 순서가 (y, x) 순서와 같으므로 (점수, 수) 튜플의 nlargest와 같은 결과를 정수 비교로 얻음
+        span = len(board)
+
+        if NUMBA_AVAILABLE:
+            # 후보 전체의 점수를 커널 한 번으로 계산 (정렬·동점 처리는 아래와 같음)
+            opponent = self.opp_stone if is_maximizing else self.my_stone
+            cells = np.array([(y + 1) * stride + x for y, x in candidates], dtype=np.int64)
+            scores = light_scores_numba(np.frombuffer(board, dtype=np.uint8), cells,
+                                        color_to_play, opponent, self.step_array)
+            if max_needed is not None and max_needed < len(candidates):
+                top = np.sort(scores * span + cells)[:-max_needed - 1:-1] % span
+                return [(i // stride - 1, i % stride) for i in top.tolist()]
+            scores = scores.tolist()
+            order = sorted(range(len(candidates)), key=scores.__getitem__, reverse=True)
+            return [candidates[k] for k in order]
+
         def get_move_score(move):
             y, x = move
-            color_to_play = self.color if is_maximizing else self.opponent
+            i = (y + 1) * stride + x
             
             # 가벼운 로컬 패턴 점수만 계산 (_check_winner 제거 - 이미 get_move와 minimax에서 처리)
-            board[y][x] = color_to_play
-            score = self._evaluate_move_pattern_light(board, y, x, color_to_play)
-            board[y][x] = "."
+            board[i] = color_to_play
+            score = self._evaluate_move_pattern_light(board, i, color_to_play)
+            board[i] = EMPTY
             return score
         
-        # 상위 K개만 필요한 경우 heapq.nlargest 사용 (O(M log K))
+        # 상위 K개만 필요한 경우 크기 K인 최소 힙을 점수 계산과 함께 유지 (O(M log K), 전체 키 목록을 만들지 않음)
         if max_needed is not None and max_needed < len(candidates):
-            return [move for _, move in heapq.nlargest(max_needed, [(get_move_score(move), move) for move in candidates])]
+            heap = []
+            for move in candidates:
+                key = get_move_score(move) * span + (move[0] + 1) * stride + move[1]
+                if len(heap) < max_needed:
+                    heapq.heappush(heap, key)
+                elif key > heap[0]:
+                    heapq.heapreplace(heap, key)
+            heap.sort(reverse=True)
+            return [(key % span // stride - 1, key % span % stride) for key in heap]
         
         # 전체 정렬 (O(M log M))
         return sorted(candidates, key=get_move_score, reverse=True)
     
-    def _evaluate_move_pattern_light(self, board: List[List[str]], y: int, x: int, color: str) -> int:
+    def _evaluate_move_pattern_light(self, board: bytearray, i: int, color: int) -> int:
         """가벼운 로컬 패턴 점수 계산 (정렬용 - 빠른 버전)"""
         score = 0
-        directions = [(1, 0), (0, 1), (1, 1), (1, -1)]
-        opponent = self.opponent if color == self.color else self.color
+        opponent = self.opp_stone if color == self.my_stone else self.my_stone
         
-        for dx, dy in directions:
+        for step in self.steps:
             # 앞쪽으로 짧게만 확인 (로컬 평가)
             count = 1
-            nx, ny = x + dx, y + dy
+            forward = i + step
             check_count = 0
-            while (check_count < 3 and 
-                   0 <= nx < self.board_size and 0 <= ny < self.board_size and 
-                   board[ny][nx] == color):
+            while check_count < 3 and board[forward] == color:
                 count += 1
-                nx += dx
-                ny += dy
+                forward += step
                 check_count += 1
             
             # 뒤쪽으로 짧게만 확인
-            back_x, back_y = x - dx, y - dy
+            backward = i - step
             check_count = 0
-            while (check_count < 3 and 
-                   0 <= back_x < self.board_size and 0 <= back_y < self.board_size and 
-                   board[back_y][back_x] == color):
+            while check_count < 3 and board[backward] == color:
                 count += 1
-                back_x -= dx
-                back_y -= dy
+                backward -= step
                 check_count += 1
             
             # 간단한 패턴 점수
@@ -468,24 +849,18 @@ class GomokuAI:
             
             # 상대 위협도 간단히 확인
             opp_count = 0
-            nx, ny = x + dx, y + dy
+            forward = i + step
             check_count = 0
-            while (check_count < 3 and 
-                   0 <= nx < self.board_size and 0 <= ny < self.board_size and 
-                   board[ny][nx] == opponent):
+            while check_count < 3 and board[forward] == opponent:
                 opp_count += 1
-                nx += dx
-                ny += dy
+                forward += step
                 check_count += 1
             
-            back_x, back_y = x - dx, y - dy
+            backward = i - step
             check_count = 0
-            while (check_count < 3 and 
-                   0 <= back_x < self.board_size and 0 <= back_y < self.board_size and 
-                   board[back_y][back_x] == opponent):
+            while check_count < 3 and board[backward] == opponent:
                 opp_count += 1
-                back_x -= dx
-                back_y -= dy
+                backward -= step
                 check_count += 1
             
             if opp_count >= 3:
@@ -495,411 +870,131 @@ class GomokuAI:
         
         return score
     
-    def _evaluate_move_pattern(self, board: List[List[str]], y: int, x: int, color: str) -> int:
-        """특정 위치에 돌을 두었을 때 생성되는 패턴 점수 계산"""
-        score = 0
-        directions = [(1, 0), (0, 1), (1, 1), (1, -1)]
-        opponent = self.opponent if color == self.color else self.color
-        
-        for dx, dy in directions:
-            # 이 방향으로 연속된 돌 개수 확인
-            count = 1
-            
-            # 앞쪽으로 연속 확인
-            nx, ny = x + dx, y + dy
-            while (0 <= nx < self.board_size and 0 <= ny < self.board_size and 
-                   board[ny][nx] == color):
-                count += 1
-                nx += dx
-                ny += dy
-            
-            # 뒤쪽으로 연속 확인
-            back_x, back_y = x - dx, y - dy
-            while (0 <= back_x < self.board_size and 
-                   0 <= back_y < self.board_size and 
-                   board[back_y][back_x] == color):
-                count += 1
-                back_x -= dx
-                back_y -= dy
-            
-            # 양쪽 끝의 상태 확인
-            # 앞쪽 끝
-            if (nx < 0 or nx >= self.board_size or 
-                ny < 0 or ny >= self.board_size):
-                forward_open = False
-            else:
-                forward_open = (board[ny][nx] == ".")
-            
-            # 뒤쪽 끝
-            if (back_x < 0 or back_x >= self.board_size or 
-                back_y < 0 or back_y >= self.board_size):
-                backward_open = False
-            else:
-                backward_open = (board[back_y][back_x] == ".")
-            
-            # 패턴 점수 추가 (내 돌 기준)
-            pattern_score = self._get_pattern_score(count, forward_open, backward_open)
-            score += pattern_score
-            
-            # 상대의 패턴도 확인 (막아야 할 위협)
-            # 앞쪽으로 상대 돌 확인
-            opp_count = 0
-            opp_nx, opp_ny = x + dx, y + dy
-            while (0 <= opp_nx < self.board_size and 0 <= opp_ny < self.board_size and 
-                   board[opp_ny][opp_nx] == opponent):
-                opp_count += 1
-                opp_nx += dx
-                opp_ny += dy
-            
-            # 뒤쪽으로 상대 돌 확인
-            opp_back_x, opp_back_y = x - dx, y - dy
-            while (0 <= opp_back_x < self.board_size and 
-                   0 <= opp_back_y < self.board_size and 
-                   board[opp_back_y][opp_back_x] == opponent):
-                opp_count += 1
-                opp_back_x -= dx
-                opp_back_y -= dy
-            
-            # 상대 패턴의 양쪽 끝 확인
-            if (opp_nx < 0 or opp_nx >= self.board_size or 
-                opp_ny < 0 or opp_ny >= self.board_size):
-                opp_forward_open = False
-            else:
-                opp_forward_open = (board[opp_ny][opp_nx] == ".")
-            
-            if (opp_back_x < 0 or opp_back_x >= self.board_size or 
-                opp_back_y < 0 or opp_back_y >= self.board_size):
-                opp_backward_open = False
-            else:
-                opp_backward_open = (board[opp_back_y][opp_back_x] == ".")
-            
-            # 상대의 위협 패턴 점수 (차단 점수)
-            if opp_count > 0:
-                opp_pattern_score = self._get_pattern_score(opp_count, opp_forward_open, opp_backward_open)
-                # 상대의 위협을 막는 것은 중요하므로 점수 추가
-                score += opp_pattern_score // 2
-        
-        return score
-    
-    def _check_winner(self, board: List[List[str]], last_move: Optional[Tuple[int, int]] = None) -> Optional[str]:
-        """보드에서 승리한 플레이어를 확인 (마지막 수 기준 최적화)"""
-        directions = [(1, 0), (0, 1), (1, 1), (1, -1)]
-        
+    def _check_winner(self, board: bytearray, last_move: Optional[int] = None) -> Optional[int]:
+        """보드에서 승리한 플레이어의 돌 값을 확인 (마지막 수 인덱스 기준 최적화)"""
         # 마지막 수가 주어지면 해당 위치 기준으로만 확인 (최적화)
         if last_move is not None:
-            y, x = last_move
-            if board[y][x] == ".":
+            i = last_move
+            color = board[i]
+            if color == EMPTY:
                 return None
             
-            color = board[y][x]
-            for dx, dy in directions:
+            # numba가 없을 때 _minimax가 후보마다 부르는 경로라 _run 호출 없이 직접 확인
+            for step in self.steps:
                 count = 1
                 # 앞쪽으로 연속 확인
-                nx, ny = x + dx, y + dy
-                while (0 <= nx < self.board_size and 0 <= ny < self.board_size and 
-                       board[ny][nx] == color):
+                forward = i + step
+                while board[forward] == color:
                     count += 1
-                    nx += dx
-                    ny += dy
+                    forward += step
                 
                 # 뒤쪽으로 연속 확인
-                back_x, back_y = x - dx, y - dy
-                while (0 <= back_x < self.board_size and 0 <= back_y < self.board_size and 
-                       board[back_y][back_x] == color):
+                backward = i - step
+                while board[backward] == color:
                     count += 1
-                    back_x -= dx
-                    back_y -= dy
+                    backward -= step
                 
                 if count >= 5:
                     return color
             return None
         
         # 전체 스캔 (마지막 수가 없을 때만)
-        for y in range(self.board_size):
-            for x in range(self.board_size):
-                if board[y][x] == ".":
-                    continue
+        steps = self.steps
+        for i, color in enumerate(board):
+            if color == EMPTY or color == WALL:
+                continue
                 
-                color = board[y][x]
-                for dx, dy in directions:
-                    count = 1
-                    nx, ny = x + dx, y + dy
-                    while (0 <= nx < self.board_size and 0 <= ny < self.board_size and 
-                           board[ny][nx] == color):
-                        count += 1
-                        nx += dx
-                        ny += dy
+            for step in steps:
+                count = 1
+                forward = i + step
+                while board[forward] == color:
+                    count += 1
+                    forward += step
                     
-                    if count >= 5:
-                        return color
+                if count >= 5:
+                    return color
         
         return None
 
-    def _evaluate_local(self, board: List[List[str]]) -> float:
+    def _evaluate_local(self, board: bytearray) -> float:
         """로컬 평가 함수 (전판 스캔 대신 빠른 평가)"""
         score = 0
-        directions = [(1, 0), (0, 1), (1, 1), (1, -1)]
+        steps = self.steps
+        my_stone = self.my_stone
         
         # 기존 돌 주변의 패턴만 빠르게 평가
-        for y in range(self.board_size):
-            for x in range(self.board_size):
-                if board[y][x] == ".":
-                    continue
+        for i, color in enumerate(board):
+            if color == EMPTY or color == WALL:
+                continue
                 
-                color = board[y][x]
-                is_my_color = (color == self.color)
+            is_my_color = (color == my_stone)
                 
-                # 각 방향으로 짧은 거리만 확인 (로컬 평가)
-                for dx, dy in directions:
-                    # 앞쪽으로 최대 4칸만 확인
-                    count = 1
-                    nx, ny = x + dx, y + dy
-                    check_count = 0
-                    while (check_count < 4 and 
-                           0 <= nx < self.board_size and 0 <= ny < self.board_size and 
-                           board[ny][nx] == color):
-                        count += 1
-                        nx += dx
-                        ny += dy
-                        check_count += 1
+            # 각 방향으로 짧은 거리만 확인 (로컬 평가)
+            for step in steps:
+                # 앞쪽으로 최대 4칸만 확인
+                count = 1
+                forward = i + step
+                check_count = 0
+                while check_count < 4 and board[forward] == color:
+                    count += 1
+                    forward += step
+                    check_count += 1
                     
-                    # 뒤쪽으로 최대 4칸만 확인
-                    back_x, back_y = x - dx, y - dy
-                    check_count = 0
-                    while (check_count < 4 and 
-                           0 <= back_x < self.board_size and 0 <= back_y < self.board_size and 
-                           board[back_y][back_x] == color):
-                        count += 1
-                        back_x -= dx
-                        back_y -= dy
-                        check_count += 1
+                # 뒤쪽으로 최대 4칸만 확인
+                backward = i - step
+                check_count = 0
+                while check_count < 4 and board[backward] == color:
+                    count += 1
+                    backward -= step
+                    check_count += 1
                     
-                    # 간단한 패턴 점수 (로컬 평가용)
-                    if count >= 5:
-                        return 1000000 if is_my_color else -1000000
-                    elif count == 4:
-                        # 양쪽 끝 확인 (간단 버전)
-                        forward_open = (0 <= nx < self.board_size and 0 <= ny < self.board_size and 
-                                       board[ny][nx] == ".") if check_count < 4 else False
-                        final_back_x, final_back_y = back_x + dx, back_y + dy
-                        backward_open = (0 <= final_back_x < self.board_size and 
-                                        0 <= final_back_y < self.board_size and 
-                                        board[final_back_y][final_back_x] == ".") if check_count < 4 else False
+                # 간단한 패턴 점수 (로컬 평가용)
+                if count >= 5:
+                    return 1000000 if is_my_color else -1000000
+                elif count == 4:
+                    # 양쪽 끝 확인 (간단 버전)
+                    forward_open = (board[forward] == EMPTY) if check_count < 4 else False
+                    backward_open = (board[backward + step] == EMPTY) if check_count < 4 else False
                         
-                        if forward_open and backward_open:
-                            score += 10000 if is_my_color else -10000
-                        elif forward_open or backward_open:
-                            score += 1000 if is_my_color else -1000
-                    elif count == 3:
-                        score += 100 if is_my_color else -100
-                    elif count == 2:
-                        score += 10 if is_my_color else -10
-        
-        return score
-    
-    def _evaluate_board(self, board: List[List[str]]) -> float:
-        """현재 보드 상태의 점수를 계산 (전판 스캔 - 느리지만 정확)"""
-        # 단순 구현: 내 돌의 연속성 점수 합산 - 상대 돌의 연속성 점수 합산
-        my_score = self._count_patterns(board, self.color)
-        op_score = self._count_patterns(board, self.opponent)
-        return my_score - op_score
-
-    def _count_patterns(self, board: List[List[str]], color: str) -> int:
-        """길이 5 윈도우를 슬라이딩하여 갭 패턴 포함 패턴 점수 계산"""
-        score = 0
-        directions = [(1, 0), (0, 1), (1, 1), (1, -1)]  # 가로, 세로, 대각선, 역대각선
-        opponent = self.opponent if color == self.color else self.color
-        window_size = 5
-        evaluated_windows = set()  # 중복 평가 방지
-        
-        for y in range(self.board_size):
-            for x in range(self.board_size):
-                for dx, dy in directions:
-                    # 윈도우의 시작 위치 계산 (중복 방지를 위해 왼쪽/위쪽에서만 시작)
-                    start_x = x - 4 * dx
-                    start_y = y - 4 * dy
-                    # 시작 위치가 유효한지 확인
-                    if start_x < 0 or start_y < 0:
-                        continue
-                    
-                    # 윈도우가 보드 밖으로 나가는지 확인
-                    end_x = start_x + (window_size - 1) * dx
-                    end_y = start_y + (window_size - 1) * dy
-                    if end_x < 0 or end_x >= self.board_size or end_y < 0 or end_y >= self.board_size:
-                        continue
-                    
-                    # 시작 위치도 다시 한번 확인 (안전을 위해)
-                    if start_x >= self.board_size or start_y >= self.board_size:
-                        continue
-                    
-                    # 윈도우 고유 식별자 (중복 방지)
-                    window_id = (start_x, start_y, dx, dy)
-                    if window_id in evaluated_windows:
-                        continue
-                    evaluated_windows.add(window_id)
-                    
-                    # 윈도우 내부 분석
-                    window_score = self._evaluate_window(board, start_x, start_y, dx, dy, window_size, color, opponent)
-                    score += window_score
-        
-        return score
-    
-    def _evaluate_window(self, board: List[List[str]], start_x: int, start_y: int, 
-                        dx: int, dy: int, window_size: int, color: str, opponent: str) -> int:
-        """길이 5 윈도우를 분석하여 패턴 점수 계산 (최대 연속 길이, 갭 위치, 혼합 윈도우 고려)"""
-        window_cells = []
-        
-        # 윈도우 내부 스캔
-        for i in range(window_size):
-            x = start_x + i * dx
-            y = start_y + i * dy
-            # 안전 체크: 인덱스 범위 확인
-            if x < 0 or x >= self.board_size or y < 0 or y >= self.board_size:
-                return 0
-            cell = board[y][x]
-            window_cells.append(cell)
-        
-        my_count = window_cells.count(color)
-        opp_count = window_cells.count(opponent)
-        empty_count = window_cells.count(".")
-        
-        # 양쪽 끝 개방 여부 확인
-        before_x = start_x - dx
-        before_y = start_y - dy
-        if (before_x < 0 or before_x >= self.board_size or 
-            before_y < 0 or before_y >= self.board_size):
-            forward_open = False
-        else:
-            forward_open = (board[before_y][before_x] == ".")
-        
-        after_x = start_x + window_size * dx
-        after_y = start_y + window_size * dy
-        if (after_x < 0 or after_x >= self.board_size or 
-            after_y < 0 or after_y >= self.board_size):
-            backward_open = False
-        else:
-            backward_open = (board[after_y][after_x] == ".")
-        
-        is_open = forward_open and backward_open
-        is_half_open = forward_open or backward_open
-        
-        score = 0
-        
-        # 내 패턴 평가
-        if my_count > 0 and opp_count == 0:
-            # 최대 연속 길이 계산
-            max_continuous = self._get_max_continuous(window_cells, color)
-            
-            # 갭 위치 분석: 한 칸 메우면 4가 되는지
-            can_make_four = self._can_make_four(window_cells, color)
-            
-            if max_continuous >= 5:
-                score += 1000000  # 승리
-            elif max_continuous == 4:
-                if is_open:
-                    score += 100000  # 열린 4
-                elif is_half_open:
-                    score += 10000   # 반열린 4
-                else:
-                    score += 1000    # 닫힌 4
-            elif max_continuous == 3:
-                if can_make_four and is_open:
-                    score += 50000   # 갭이 있는 열린 3 (다음 수에 4 가능)
-                elif is_open:
-                    score += 1000    # 열린 3
-                elif is_half_open:
-                    score += 100     # 반열린 3
-                else:
-                    score += 10      # 닫힌 3
-            elif max_continuous == 2:
-                if is_open:
-                    score += 10      # 열린 2
-                elif is_half_open:
-                    score += 1      # 반열린 2
-        
-        # 상대 위협 평가 (혼합 윈도우도 고려)
-        if opp_count > 0:
-            opp_max_continuous = self._get_max_continuous(window_cells, opponent)
-            opp_can_make_four = self._can_make_four(window_cells, opponent)
-            
-            if opp_max_continuous >= 5:
-                score -= 1000000  # 상대 승리 위협
-            elif opp_max_continuous == 4:
-                if is_open:
-                    score -= 100000  # 상대 열린 4 위협
-                elif is_half_open:
-                    score -= 10000
-                else:
-                    score -= 1000
-            elif opp_max_continuous == 3:
-                if opp_can_make_four and is_open:
-                    score -= 50000   # 상대 갭이 있는 열린 3 위협
-                elif is_open:
-                    score -= 1000
-                elif is_half_open:
-                    score -= 100
-            elif opp_max_continuous == 2:
-                if is_open:
-                    score -= 10
+                    if forward_open and backward_open:
+                        score += 10000 if is_my_color else -10000
+                    elif forward_open or backward_open:
+                        score += 1000 if is_my_color else -1000
+                elif count == 3:
+                    score += 100 if is_my_color else -100
+                elif count == 2:
+                    score += 10 if is_my_color else -10
         
         return score
-    
-    def _get_max_continuous(self, cells: List[str], color: str) -> int:
-        """윈도우 내에서 최대 연속 길이 계산"""
-        max_continuous = 0
-        current = 0
-        
-        for cell in cells:
-            if cell == color:
-                current += 1
-                max_continuous = max(max_continuous, current)
-            else:
-                current = 0
-        
-        return max_continuous
-    
-    def _can_make_four(self, cells: List[str], color: str) -> bool:
-        """한 칸 메우면 4가 되는지 확인 (갭 위치 고려)"""
-        # 빈칸이 1개이고, 나머지 4개가 모두 color인 경우
-        if cells.count(".") == 1 and cells.count(color) == 4:
-            return True
-        
-        # 갭이 있는 3 연속 패턴 확인 (예: X X . X 또는 X . X X)
-        for i in range(len(cells) - 3):
-            window = cells[i:i+4]
-            if window.count(color) == 3 and window.count(".") == 1:
-                return True
-        
-        return False
-    
-    def _get_pattern_score(self, count: int, forward_open: bool, backward_open: bool) -> int:
-        """패턴 길이와 개방 상태에 따른 점수 계산"""
-        if count >= 5:
-            return 1000000  # 5연속 (승리)
-        
-        is_open = forward_open and backward_open
-        is_half_open = forward_open or backward_open
-        
-        if count == 4:
-            if is_open:
-                return 100000  # 열린 4 (다음 수에 승리 가능)
-            elif is_half_open:
-                return 10000   # 반열린 4
-            else:
-                return 1000    # 닫힌 4
-        elif count == 3:
-            if is_open:
-                return 1000    # 열린 3
-            elif is_half_open:
-                return 100     # 반열린 3
-            else:
-                return 10      # 닫힌 3
-        elif count == 2:
-            if is_open:
-                return 10      # 열린 2
-            elif is_half_open:
-                return 1       # 반열린 2
-            else:
-                return 0       # 닫힌 2 (거의 가치 없음)
-        
-        return 0  # 1개는 점수 없음
\ No newline at end of file
+
+
+# 병렬 루트 탐색의 작업 프로세스마다 하나씩 두고 재사용하는 AI (같은 탐색 동안 치환표 공유)
+_worker_ai: Optional[GomokuAI] = None
+_worker_search = 0
+
+
+def _search_root_child(board_bytes: bytes, board_size: int, color: str, move: Tuple[int, int],
+                       depth: int, alpha: float, search_count: int) -> float:
+    """작업 프로세스에서 루트 후보 하나를 두고 그 아래를 탐색한 점수 반환"""
+    global _worker_ai, _worker_search
+    ai = _worker_ai
+    if ai is None or ai.board_size != board_size:
+        ai = _worker_ai = GomokuAI(color)
+        ai._init_tables(board_size)
+    if search_count != _worker_search:
+        ai.tt.clear()
+        ai.killers.clear()
+        ai.history = [0] * len(board_bytes)
+        _worker_search = search_count
+    ai.color = color
+    ai.opponent = "O" if color == "X" else "X"
+    ai.my_stone = ord(ai.color)
+    ai.opp_stone = ord(ai.opponent)
+
+    board = bytearray(board_bytes)
+    ai._reset_eval(board)
+    y, x = move
+    i = (y + 1) * ai.stride + x
+    board_hash = ai._hash_board(board) ^ ai.zobrist_table[ai.my_stone][i]
+    ai._play(board, i, ai.my_stone)
+    return ai._minimax(board, depth - 1, False, alpha, float('inf'), board_hash)
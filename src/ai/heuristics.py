@@ -72,12 +72,8 @@ class Heuristic:
     @staticmethod
     def _line_start(pos: Position, player: Player, dx: int, dy: int, board) -> Position:
         """First cell of the line going backward along (-dx, -dy)."""
-        cur = pos
-        while True:
-            nx, ny = cur.x - dx, cur.y - dy
-            if not (1 <= nx <= board.size and 1 <= ny <= board.size):
-                return cur
-            prev = Position(nx, ny)
-            if board.get(prev) != player:
-                return cur
-            cur = prev
+        x, y = pos.x, pos.y
+        while 1 <= x - dx <= board.size and 1 <= y - dy <= board.size and board.get_xy(x - dx, y - dy) == player:
+            x -= dx
+            y -= dy
+        return pos if (x, y) == (pos.x, pos.y) else Position(x, y)
@@ -28,6 +28,7 @@ class MinimaxAI:
         self.use_multiprocessing = use_multiprocessing
         self.nodes_explored = 0
         self.depth_reached = 0
+        self._heuristic: Optional[Heuristic] = None  # bound to the game being searched
 
     def get_best_move(self, game: Game) -> Optional[Position]:
         """Find best move within time_limit using iterative deepening."""
@@ -42,6 +43,9 @@ class MinimaxAI:
         total_nodes = 0
         max_depth = self.level_config.max_depth
 
+        # Search makes/unmakes moves in place; keep the caller's game untouched
+        game = game.copy()
+
         move_gen = MoveGenerator(game, level_config=self.level_config)
         max_moves = MAX_MOVES_DEPTH_HIGH if max_depth >= 5 else MAX_MOVES_DEPTH_LOW
         possible_moves = move_gen.get_ordered_moves(max_moves=max_moves)
@@ -124,16 +128,17 @@ class MinimaxAI:
         beta: float,
     ) -> float:
         """Score one root move by making it and running alpha-beta for opponent."""
-        game_copy = game.copy()
-        result = game_copy.make_move(move)
+        result = game.make_move(move)
         if not result.success:
             return float("-inf")
         if result.is_winning_move:
+            game.undo_last_move()
             return WEIGHT_WIN + depth
-        game_copy.switch_player()
+        game.switch_player()
         score, _ = self._alpha_beta(
-            game_copy, depth - 1, alpha, beta, False, maximizing_player
+            game, depth - 1, alpha, beta, False, maximizing_player
         )
+        game.undo_last_move()
         return score
 
     def _alpha_beta(
@@ -149,32 +154,31 @@ class MinimaxAI:
         self.nodes_explored += 1
 
         if depth == 0 or game.is_game_over():
-            h = Heuristic(game)
-            return h.evaluate(maximizing_player, depth), None
+            return self._evaluate_leaf(game, maximizing_player, depth), None
 
         move_gen = MoveGenerator(game, level_config=self.level_config)
         max_moves = MAX_MOVES_DEPTH_HIGH if depth >= 5 else MAX_MOVES_DEPTH_LOW
         possible_moves = move_gen.get_ordered_moves(max_moves=max_moves)
 
         if not possible_moves:
-            h = Heuristic(game)
-            return h.evaluate(maximizing_player, depth), None
+            return self._evaluate_leaf(game, maximizing_player, depth), None
 
         best_move = None
 
         if is_maximizing:
             max_eval = float("-inf")
             for move in possible_moves:
-                game_copy = game.copy()
-                result = game_copy.make_move(move)
+                result = game.make_move(move)
                 if not result.success:
                     continue
                 if result.is_winning_move:
+                    game.undo_last_move()
                     return WEIGHT_WIN + depth, move
-                game_copy.switch_player()
+                game.switch_player()
                 eval_score, _ = self._alpha_beta(
-                    game_copy, depth - 1, alpha, beta, False, maximizing_player
+                    game, depth - 1, alpha, beta, False, maximizing_player
                 )
+                game.undo_last_move()
                 if eval_score > max_eval:
                     max_eval = eval_score
                     best_move = move
@@ -185,16 +189,17 @@ class MinimaxAI:
 
         min_eval = float("inf")
         for move in possible_moves:
-            game_copy = game.copy()
-            result = game_copy.make_move(move)
+            result = game.make_move(move)
             if not result.success:
                 continue
             if result.is_winning_move:
+                game.undo_last_move()
                 return -(WEIGHT_WIN + depth), move
-            game_copy.switch_player()
+            game.switch_player()
             eval_score, _ = self._alpha_beta(
-                game_copy, depth - 1, alpha, beta, True, maximizing_player
+                game, depth - 1, alpha, beta, True, maximizing_player
             )
+            game.undo_last_move()
             if eval_score < min_eval:
                 min_eval = eval_score
                 best_move = move
@@ -202,3 +207,10 @@ class MinimaxAI:
             if beta <= alpha:
                 break
         return min_eval, best_move
+
+    def _evaluate_leaf(self, game: Game, maximizing_player, depth: int) -> int:
+        """Heuristic score of a leaf, reusing one evaluator for the searched game."""
+        h = self._heuristic
+        if h is None or h.game is not game:
+            h = self._heuristic = Heuristic(game)
+        return h.evaluate(maximizing_player, depth)
@@ -113,37 +113,40 @@ class MoveGenerator:
         Evaluate priority of a move for move ordering (higher = better).
         Tests our move (win + threats) and blocking opponent win/threats.
         """
-        player = self.game.current_player
+        game = self.game
+        board = game.board
+        player = game.current_player
         opponent = player.opponent()
         priority = 0
 
-        # Test current player's move
-        test = self.game.copy()
-        result = test.make_move(position)
+        # Test current player's move (made and undone in place)
+        result = game.make_move(position)
         if not result.success:
             return 0
         if result.is_winning_move:
+            game.undo_last_move()
             return 50_000
-        for dx, dy in test.board.directions():
-            length = test.board.line_length_through(position, player, dx, dy)
+        for dx, dy in board.directions():
+            length = board.line_length_through(position, player, dx, dy)
             if length >= 4:
                 priority += 15_000
             elif length == 3:
                 priority += 200
             elif length == 2:
                 priority += 20
-        test.undo_last_move()
+        game.undo_last_move()
 
         # Test opponent's move at same cell (blocking)
-        block = self.game.copy()
-        block.switch_player()
-        res = block.make_move(position)
+        game.switch_player()
+        res = game.make_move(position)
         if res.success and res.is_winning_move:
             priority += 45_000
         if res.success:
-            for dx, dy in block.board.directions():
-                length = block.board.line_length_through(position, opponent, dx, dy)
+            for dx, dy in board.directions():
+                length = board.line_length_through(position, opponent, dx, dy)
                 if length >= 4:
                     priority += 12_000
                     break
+            game.undo_last_move()
+        game.switch_player()
         return priority
@@ -1,7 +1,8 @@
-from typing import List, Tuple, Iterator, Optional, Set, overload
+from typing import Dict, List, Tuple, Iterator, Optional, Set, overload
 import numpy as np
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 class Player(Enum):
     """Player constants."""
@@ -23,7 +24,7 @@ class Player(Enum):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Position:
     """
     Immutable position on the board.
@@ -47,6 +48,21 @@ class Position:
         """Check if this position is within board size."""
         return 1 <= self.x <= size and 1 <= self.y <= size
     
+@lru_cache(maxsize=None)
+def _neighbor_table(size: int, distance: int) -> Tuple[Tuple[int, ...], ...]:
+    """Row-major cell indices within Chebyshev distance of each cell (excluding itself)."""
+    table = []
+    for r in range(size):
+        for c in range(size):
+            table.append(tuple(
+                nr * size + nc
+                for nr in range(max(r - distance, 0), min(r + distance, size - 1) + 1)
+                for nc in range(max(c - distance, 0), min(c + distance, size - 1) + 1)
+                if nr != r or nc != c
+            ))
+    return tuple(table)
+
+
 class Board:
     """
     Represents the game board state.
@@ -63,6 +79,10 @@ class Board:
             [Player.EMPTY for _ in range(size)] for _ in range(size)
         ]
         self._moves: int = 0  # number of placed stones (non-empty)
+        self._occupied: Set[int] = set()  # row-major indices of placed stones
+        # distance -> (stones within distance of each cell, cells with a count > 0),
+        # built on first query and kept up to date by place/unplace
+        self._near: Dict[int, Tuple[List[int], Set[int]]] = {}
 
     @property
     def size(self) -> int:
@@ -77,6 +97,10 @@ class Board:
         new_board = Board(self.size)
         new_board._grid = np.copy(self._grid)
         new_board._moves = self._moves
+        new_board._occupied = set(self._occupied)
+        new_board._near = {
+            d: (list(counts), set(reached)) for d, (counts, reached) in self._near.items()
+        }
         return new_board
     
     # ---------- Bounds / indexing ----------
@@ -111,6 +135,10 @@ class Board:
         r, c = self._idx(pos)
         return self._grid[r][c]
 
+    def get_xy(self, x: int, y: int) -> Player:
+        """Read the cell at 1-based (x, y) without building a Position; caller checks bounds."""
+        return self._grid[y - 1][x - 1]
+
     def is_empty(self, pos: Position) -> bool:
         return self.get(pos) == Player.EMPTY
 
@@ -128,6 +156,14 @@ class Board:
             raise ValueError(f"Cell occupied at {pos}")
         self._grid[r][c] = player
         self._moves += 1
+
+        idx = r * self._size + c
+        self._occupied.add(idx)
+        for distance, (counts, reached) in self._near.items():
+            for n in _neighbor_table(self._size, distance)[idx]:
+                counts[n] += 1
+                if counts[n] == 1:
+                    reached.add(n)
         
     def unplace(self, pos: Position) -> None:
         """
@@ -146,6 +182,14 @@ class Board:
         self._grid[r][c] = Player.EMPTY
         self._moves -= 1
 
+        idx = r * self._size + c
+        self._occupied.discard(idx)
+        for distance, (counts, reached) in self._near.items():
+            for n in _neighbor_table(self._size, distance)[idx]:
+                counts[n] -= 1
+                if counts[n] == 0:
+                    reached.discard(n)
+
     def swap_colors(self) -> None:
         """
         Swap BLACK <-> WHITE stones on the board.
@@ -164,6 +208,8 @@ class Board:
             for c in range(self._size):
                 self._grid[r][c] = Player.EMPTY
         self._moves = 0
+        self._occupied = set()
+        self._near = {}
 
     # ---------- Iteration / helpers ----------
 
@@ -205,20 +251,22 @@ class Board:
         if self.is_empty_board():
             return [Position(x, y) for y in range(1, self._size + 1) for x in range(1, self._size + 1)]
 
-        candidates: Set[Position] = set()
-
-        for (pos, _) in self.iter_stones():
-            for dy in range(-distance, distance + 1):
-                for dx in range(-distance, distance + 1):
-                    if dx == 0 and dy == 0:
-                        continue
-                    nx, ny = pos.x + dx, pos.y + dy
-                    if 1 <= nx <= self._size and 1 <= ny <= self._size:
-                        npos = Position(nx, ny)
-                        if self.is_empty(npos):
-                            candidates.add(npos)
-
-        return sorted(candidates, key=lambda p: (p.y, p.x))
+        if distance not in self._near:
+            self._near[distance] = self._build_near(distance)
+        _, reached = self._near[distance]
+
+        # Row-major cell indices sort in the same (y, x) order as positions
+        size = self._size
+        return [Position(i % size + 1, i // size + 1) for i in sorted(reached - self._occupied)]
+
+    def _build_near(self, distance: int) -> Tuple[List[int], Set[int]]:
+        """Count the stones around every cell from scratch (first query per distance)."""
+        table = _neighbor_table(self._size, distance)
+        counts = [0] * (self._size * self._size)
+        for idx in self._occupied:
+            for n in table[idx]:
+                counts[n] += 1
+        return counts, {i for i, n in enumerate(counts) if n}
     
     # ---------- Directional scan (for win checks, patterns, renju later) ----------
 
@@ -240,15 +288,13 @@ class Board:
         excluding the start cell itself.
         """
         count = 0
-        cur = start
-        while True:
-            nxt = self.step(cur, dx, dy)
-            if nxt is None:
-                break
-            if self.get(nxt) != player:
-                break
+        size = self._size
+        grid = self._grid
+        x, y = start.x + dx, start.y + dy
+        while 1 <= x <= size and 1 <= y <= size and grid[y - 1][x - 1] == player:
             count += 1
-            cur = nxt
+            x += dx
+            y += dy
         return count
 
     def line_length_through(self, pos: Position, player: Player, dx: int, dy: int) -> int:
@@ -57,38 +57,26 @@ class MoveValidator:
     # Virtual evaluation helpers (do NOT mutate the board)
     # ============================================================
 
-    def _cell_virtual(self, board: Board, pos: Position, placed_pos: Position, placed_player: Player) -> Player:
-        if pos == placed_pos:
+    def _cell_virtual(self, board: Board, x: int, y: int, placed_pos: Position, placed_player: Player) -> Player:
+        if x == placed_pos.x and y == placed_pos.y:
             return placed_player
-        return board.get(pos)
+        return board.get_xy(x, y)
 
     def _line_length_through_virtual(self, board: Board, center: Position, player: Player, dx: int, dy: int) -> int:
         # count same-color stones through center in direction (dx,dy), including center as player
         total = 1
 
         # forward
-        cur = center
-        while True:
-            nx, ny = cur.x + dx, cur.y + dy
-            if not board.in_bounds(nx, ny):
-                break
-            nxt = Position(nx, ny)
-            if self._cell_virtual(board, nxt, center, player) != player:
-                break
+        nx, ny = center.x + dx, center.y + dy
+        while board.in_bounds(nx, ny) and self._cell_virtual(board, nx, ny, center, player) == player:
             total += 1
-            cur = nxt
+            nx, ny = nx + dx, ny + dy
 
         # backward
-        cur = center
-        while True:
-            nx, ny = cur.x - dx, cur.y - dy
-            if not board.in_bounds(nx, ny):
-                break
-            nxt = Position(nx, ny)
-            if self._cell_virtual(board, nxt, center, player) != player:
-                break
+        nx, ny = center.x - dx, center.y - dy
+        while board.in_bounds(nx, ny) and self._cell_virtual(board, nx, ny, center, player) == player:
             total += 1
-            cur = nxt
+            nx, ny = nx - dx, ny - dy
 
         return total
 
@@ -127,12 +115,10 @@ class MoveValidator:
         chars: List[str] = []
         for k in range(-span, span + 1):
             nx, ny = center.x + k * dx, center.y + k * dy
-            # Check bounds before creating Position (Position requires x,y >= 1)
             if not (1 <= nx <= board.size and 1 <= ny <= board.size):
                 chars.append("X")
                 continue
-            pos = Position(nx, ny)
-            cell = self._cell_virtual(board, pos, center, player)
+            cell = self._cell_virtual(board, nx, ny, center, player)
             if cell == Player.EMPTY:
                 chars.append(".")
             elif cell == Player.BLACK: